@@ -12,6 +12,7 @@ REQUIREMENTS_FILE = PROJECT_ROOT / "requirements.txt"
 
 # Configurazione video
 MAX_VIDEOS = 4
+VIDEO_LOADER_MAX_THREADS = 4  # Thread massimi per il probing asincrono (limitati dai core disponibili)
 SUPPORTED_VIDEO_FORMATS = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv']
 
 # Configurazione playback
@@ -21,6 +22,7 @@ FRAME_STEP_OPTIONS = [40, 100, 200] # Mantenuto per frame stepping
 
 # Configurazione esportazione
 DEFAULT_EXPORT_WINDOW = 5
+EXPORT_MAX_WORKERS = 4  # Processi FFmpeg paralleli massimi (ogni FFmpeg è già multi-thread)
 EXPORT_SETTINGS_FILE = PROJECT_ROOT / "export_settings.json"  # File per salvare preferenze export
 LOG_FILE = PROJECT_ROOT / "syncview_log.txt"
 DEVELOPER_LOG = PROJECT_ROOT / "DEVELOPER_LOG.md"
@@ -38,6 +40,7 @@ REQUIRED_PACKAGES = [
     "numpy",
     "PIL"
 ]
+DEPENDENCY_CACHE_TTL_S = 30.0  # Validità (secondi) del risultato memoizzato del controllo dipendenze
 
 # Tema UI - Palette Tattica "Night Ops"
 THEME_COLORS = {
@@ -110,6 +110,15 @@ class UserPathManager:
             return self.video_paths[index]
         return None
     
+    def get_all_video_paths(self) -> List[Optional[Path]]:
+        """
+        Ottiene i path di tutti gli slot video in un'unica chiamata.
+        
+        Returns:
+            Lista (copia) di 4 elementi: Path del video o None
+        """
+        return list(self.video_paths)
+    
     def clear_video_path(self, index: int) -> None:
         """
         Cancella il path di un video.
@@ -8,18 +8,20 @@ Versione 3.0 - Export avanzato con:
 - Retry automatico su fallimenti transienti
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple, Any
+from typing import List, Optional, Dict, Tuple, Any, Sequence
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
 import time
 import subprocess
-import multiprocessing as mp
+import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 
+from config.settings import EXPORT_MAX_WORKERS
 from core.markers import Marker
 from core.logger import logger
 
@@ -228,6 +230,15 @@ class ExportQueue:
             self.jobs = {}
 
 
+@lru_cache(maxsize=1)
+def default_export_workers() -> int:
+    """Numero di processi di export di default: CPU - 1 (un core resta alla GUI), max EXPORT_MAX_WORKERS.
+
+    Memoizzato: il numero di CPU non cambia durante la vita del processo.
+    """
+    return max(1, min(EXPORT_MAX_WORKERS, (os.cpu_count() or 2) - 1))
+
+
 def export_clip_ffmpeg(job: ExportJob, quality: ExportQuality, 
                        encoder: HardwareEncoder) -> Tuple[bool, Optional[str]]:
     """
@@ -310,7 +321,7 @@ class AdvancedVideoExporter(QObject):
     
     def __init__(self, 
                  video_paths: Dict[int, Path],
-                 markers: List[Marker],
+                 markers: Sequence[Marker],
                  sec_before: int,
                  sec_after: int,
                  export_dir: Path,  # Ora obbligatorio
@@ -331,9 +342,8 @@ class AdvancedVideoExporter(QObject):
         self.is_running = True
         self.max_retries = max_retries
         
-        # Determina numero di worker (default: CPU count - 1, min 1)
-        cpu_count = mp.cpu_count()
-        self.max_workers = max_workers if max_workers else max(1, cpu_count - 1)
+        # Determina numero di worker (default: CPU count - 1, min 1, max EXPORT_MAX_WORKERS)
+        self.max_workers = max_workers if max_workers else default_export_workers()
         
         # Export queue
         self.queue = ExportQueue()        # Rileva hardware encoder disponibili
@@ -518,7 +528,7 @@ class AdvancedVideoExporter(QObject):
             
             # Processa i risultati man mano che completano
             for future in as_completed(future_to_job):
-                if not self.is_running:
+                if not self.is_running or self._interruption_requested():
                     # Cancellazione richiesta
                     executor.shutdown(wait=False, cancel_futures=True)
                     self.error.emit("Export cancellato dall'utente.")
@@ -624,6 +634,11 @@ class AdvancedVideoExporter(QObject):
         
         self.finished.emit(success_msg)
     
+    def _interruption_requested(self) -> bool:
+        """Verifica se il thread che esegue l'export ha ricevuto requestInterruption()."""
+        thread = QThread.currentThread()
+        return thread is not None and thread.isInterruptionRequested()
+    
     def stop(self):
         """Ferma il processo di export."""
         self.is_running = False
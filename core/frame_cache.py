@@ -3,7 +3,7 @@ Sistema di caching dei frame per migliorare le performance di seek e playback.
 Implementa una cache LRU (Least Recently Used) per i frame video.
 """
 from collections import OrderedDict, deque
-from typing import Optional, Any
+from typing import Optional, Any, Hashable
 from pathlib import Path
 import threading
 from core.logger import logger
@@ -22,11 +22,11 @@ class LRUCache:
             capacity: Numero massimo di frame da mantenere in cache
         """
         self.capacity = capacity
-        self.cache: OrderedDict[str, Any] = OrderedDict()
+        self.cache: OrderedDict[Hashable, Any] = OrderedDict()
         self.hits = 0
         self.misses = 0
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Recupera un elemento dalla cache.
         
         Args:
@@ -44,7 +44,7 @@ class LRUCache:
             self.misses += 1
             return None
     
-    def put(self, key: str, value: Any) -> None:
+    def put(self, key: Hashable, value: Any) -> None:
         """Inserisce un elemento nella cache.
         
         Args:
@@ -122,18 +122,17 @@ class FrameCache:
         self.playback_direction = 1  # 1 = avanti, -1 = indietro
         self.predecode_distance = 1000  # ms da pre-caricare
     
-    def _make_key(self, position_ms: int) -> str:
+    def _make_key(self, position_ms: int) -> int:
         """Crea una chiave cache da una posizione.
         
         Args:
             position_ms: Posizione in millisecondi
             
         Returns:
-            Chiave stringa per la cache
+            Chiave intera per la cache (la cache è già per-video)
         """
         # Arrotonda alla posizione più vicina (ogni 100ms)
-        rounded = (position_ms // 100) * 100
-        return f"{self.video_path.name}:{rounded}"
+        return (position_ms // 100) * 100
     
     def mark_position_visited(self, position_ms: int) -> None:
         """Marca una posizione come visitata.
@@ -68,6 +68,16 @@ class SyncViewLogger:
             handler.stream.write(header)
         self.logger.info("Applicazione SyncView avviata")
     
+    def is_debug_enabled(self):
+        """True se almeno un handler registra i messaggi di livello DEBUG.
+        
+        Permette ai chiamanti di saltare la raccolta di dati diagnostici
+        costosi quando nessuno li scriverebbe.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return False
+        return any(handler.level <= logging.DEBUG for handler in self.logger.handlers)
+    
     def log_dependency_check(self, missing_packages):
         """Registra il risultato del controllo dipendenze."""
         if not missing_packages:
@@ -75,19 +85,19 @@ class SyncViewLogger:
         else:
             self.logger.warning(f"✗ Dipendenze mancanti: {', '.join(missing_packages)}")
     
-    def log_user_action(self, action, details=""):
-        """Registra un'azione dell'utente."""
+    def log_user_action(self, action, details="", level=logging.INFO):
+        """Registra un'azione dell'utente (di default a livello INFO)."""
         msg = f"[AZIONE UTENTE] {action}"
         if details:
             msg += f" - {details}"
-        self.logger.info(msg)
+        self.logger.log(level, msg)
     
-    def log_video_action(self, video_index, action, details=""):
-        """Registra un'azione su un video specifico."""
+    def log_video_action(self, video_index, action, details="", level=logging.INFO):
+        """Registra un'azione su un video specifico (di default a livello INFO)."""
         msg = f"[VIDEO {video_index + 1}] {action}"
         if details:
             msg += f" - {details}"
-        self.logger.info(msg)
+        self.logger.log(level, msg)
     
     def log_playback(self, video_index, state):
         """Registra cambio stato riproduzione di un video."""
@@ -4,10 +4,14 @@ Permette di annotare punti specifici nei video con etichette, colori e descrizio
 Versione 3.1 - Con supporto SQLite per storage efficiente.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Iterable, List, Dict, Optional
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 import json
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
 from pathlib import Path
 
 
@@ -41,6 +45,48 @@ class Marker:
         return cls(**data)
 
 
+def _marker_timestamp(marker: Marker) -> int:
+    """Chiave di ordinamento/ricerca dei markers."""
+    return marker.timestamp
+
+
+class MarkerSaveJob:
+    """Salvataggio completo già preparato (snapshot catturato sul thread GUI).
+    
+    La chiamata esegue solo l'IO e può girare su qualsiasi thread; le scritture
+    sono serializzate dal lock del manager e uno snapshot più vecchio di uno già
+    scritto viene scartato. I flag di modifica non vengono toccati: in caso di
+    errore il chiamante invoca mark_unsaved() sul thread GUI.
+    """
+    
+    def __init__(self, manager: 'MarkerManager', write: Callable[[], bool],
+                 generation: int, modified_ids: set):
+        self._manager = manager
+        self._write = write
+        self._generation = generation
+        self._modified_ids = modified_ids
+    
+    def __call__(self) -> bool:
+        manager = self._manager
+        with manager._write_lock:
+            if self._generation < manager._written_generation:
+                return True  # Uno snapshot più recente è già su disco
+            try:
+                success = self._write()
+            except Exception as e:
+                print(f"Errore salvataggio markers: {e}")
+                success = False
+            if success:
+                manager._written_generation = self._generation
+        return success
+    
+    def mark_unsaved(self) -> None:
+        """Ripristina i flag di modifica dopo un salvataggio fallito (thread GUI)."""
+        manager = self._manager
+        manager._modified = True
+        manager._modified_markers.update(self._modified_ids)
+
+
 class MarkerManager:
     """Gestisce la collezione di markers per un progetto."""
     
@@ -81,6 +127,10 @@ class MarkerManager:
         self.use_database = use_database
         self._db = None
         self._modified_markers = set()  # Track di marker modificati per incremental save
+        # Serializza tutte le scritture (sync, auto-save sul pool, incrementali)
+        self._write_lock = threading.Lock()
+        self._save_generation = 0  # Ultimo snapshot preparato
+        self._written_generation = 0  # Ultimo snapshot scritto con successo
         
         # Inizializza database se abilitato
         if self.use_database and project_path:
@@ -115,8 +165,7 @@ class MarkerManager:
             category=category,
             video_index=video_index
         )
-        self.markers.append(marker)
-        self.markers.sort(key=lambda m: m.timestamp)  # Mantieni ordinato
+        insort(self.markers, marker, key=_marker_timestamp)  # Mantieni ordinato
         self._modified = True
         self._modified_markers.add(marker.id)  # Track marker modificato
         
@@ -150,6 +199,55 @@ class MarkerManager:
                 return True
         return False
     
+    def replace_global_with_per_video(self, marker_id: str, video_indices: Iterable[int]) -> List[Marker]:
+        """
+        Sostituisce un marker globale con copie specifiche per i video indicati.
+        
+        Rimozione e inserimenti avvengono in un'unica mutazione della lista
+        (le copie hanno lo stesso timestamp: prendono il posto dell'originale)
+        e con un solo salvataggio incrementale.
+        
+        Args:
+            marker_id: ID del marker globale da sostituire
+            video_indices: Indici dei video che mantengono il marker
+            
+        Returns:
+            I marker creati (lista vuota se il marker non esiste o non è globale)
+        """
+        for i, marker in enumerate(self.markers):
+            if marker.id == marker_id:
+                break
+        else:
+            return []
+        if marker.video_index is not None:
+            return []
+        
+        copies = [
+            Marker(
+                timestamp=marker.timestamp,
+                color=marker.color,
+                description=marker.description,
+                category=marker.category,
+                video_index=video_index,
+                # ID esplicito: create in sequenza, con un clock a bassa risoluzione
+                # avrebbero tutte lo stesso ID generato da __post_init__
+                id=f"{marker.id}_v{video_index}"
+            )
+            for video_index in video_indices
+        ]
+        self.markers[i:i + 1] = copies
+        self._modified = True
+        self._modified_markers.update(m.id for m in copies)
+        
+        # Rimuovi il marker globale dal database se abilitato
+        if self.use_database and self._db:
+            self._db.delete_marker(marker_id)
+        
+        if self.auto_save_enabled and self.project_path:
+            self.save_incremental()
+        
+        return copies
+    
     def update_marker(self, marker_id: str, **kwargs) -> Optional[Marker]:
         """
         Aggiorna attributi di un marker.
@@ -169,7 +267,7 @@ class MarkerManager:
                 
                 # Riordina se timestamp cambiato
                 if 'timestamp' in kwargs:
-                    self.markers.sort(key=lambda m: m.timestamp)
+                    self.markers.sort(key=_marker_timestamp)
                 
                 self._modified = True
                 self._modified_markers.add(marker_id)  # Track marker modificato
@@ -244,10 +342,9 @@ class MarkerManager:
         Returns:
             Il prossimo marker o None
         """
-        for marker in self.markers:
-            if marker.timestamp > current_timestamp:
-                return marker
-        return None
+        # markers è ordinato per timestamp: ricerca binaria O(log n)
+        index = bisect_right(self.markers, current_timestamp, key=_marker_timestamp)
+        return self.markers[index] if index < len(self.markers) else None
     
     def get_previous_marker(self, current_timestamp: int) -> Optional[Marker]:
         """
@@ -259,10 +356,8 @@ class MarkerManager:
         Returns:
             Il marker precedente o None
         """
-        for marker in reversed(self.markers):
-            if marker.timestamp < current_timestamp:
-                return marker
-        return None
+        index = bisect_left(self.markers, current_timestamp, key=_marker_timestamp)
+        return self.markers[index - 1] if index > 0 else None
     
     def clear_all(self):
         """Rimuove tutti i markers."""
@@ -283,37 +378,63 @@ class MarkerManager:
         Returns:
             True se salvato con successo
         """
+        save_job = self.prepare_save(path)
+        if save_job is None:
+            return False
+        success = save_job()
+        if not success:
+            save_job.mark_unsaved()
+        return success
+    
+    def prepare_save(self, path: Optional[Path] = None) -> Optional[MarkerSaveJob]:
+        """
+        Prepara un salvataggio completo eseguibile anche fuori dal thread GUI.
+        
+        Cattura subito uno snapshot dei markers e azzera i flag di modifica
+        (da chiamare sul thread GUI): il job ritornato esegue solo l'IO
+        (SQLite o JSON); se fallisce, mark_unsaved() ripristina i flag.
+        
+        Args:
+            path: Path del file (usa project_path se None)
+            
+        Returns:
+            Job che esegue il salvataggio, None se non c'è un path
+        """
         save_path = path or self.project_path
         
         if not save_path:
-            return False
+            return None
         
-        try:
-            if self.use_database and self._db:
-                # Salva nel database SQLite
-                success = self._db.save_markers_batch(self.markers)
-                if success:
-                    self._modified = False
-                    self._modified_markers.clear()
-                return success
-            else:
-                # Salva in JSON (legacy)
-                data = {
-                    'version': '3.0',
-                    'created_at': datetime.now().isoformat(),
-                    'markers': [m.to_dict() for m in self.markers]
-                }
-                
-                with open(save_path, 'w', encoding='utf-8') as f:
+        if self.use_database and self._db:
+            # Salva nel database SQLite (una connessione per chiamata: thread-safe).
+            # Copie dei marker: il job sul pool non deve leggere oggetti che update_marker
+            # modifica sul thread GUI
+            db = self._db
+            markers = [replace(m) for m in self.markers]
+            
+            def write() -> bool:
+                return db.save_markers_batch(markers)
+        else:
+            # Salva in JSON (legacy): scrittura su file temporaneo + rename atomico
+            data = {
+                'version': '3.0',
+                'created_at': datetime.now().isoformat(),
+                'markers': [m.to_dict() for m in self.markers]
+            }
+            
+            def write() -> bool:
+                tmp_path = Path(save_path).with_name(Path(save_path).name + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                self._modified = False
-                self._modified_markers.clear()
+                os.replace(tmp_path, save_path)
                 return True
-            
-        except Exception as e:
-            print(f"Errore salvataggio markers: {e}")
-            return False
+        
+        modified_ids = set(self._modified_markers)
+        self._modified = False
+        self._modified_markers.clear()
+        self._save_generation += 1
+        
+        return MarkerSaveJob(self, write, self._save_generation, modified_ids)
     
     def load(self, path: Optional[Path] = None) -> bool:
         """
@@ -352,7 +473,7 @@ class MarkerManager:
                     marker = Marker.from_dict(marker_data)
                     self.markers.append(marker)
                 
-                self.markers.sort(key=lambda m: m.timestamp)
+                self.markers.sort(key=_marker_timestamp)
                 self._modified = False
                 self._modified_markers.clear()
                 return True
@@ -410,24 +531,13 @@ class MarkerManager:
         Returns:
             Dizionario con statistiche
         """
-        stats = {
-            'total': len(self.markers),
-            'by_category': {},
-            'by_color': {},
+        markers = self.markers
+        # Counter conta in C (stesso ordine di prima apparizione del vecchio loop)
+        return {
+            'total': len(markers),
+            'by_category': dict(Counter(m.category for m in markers)),
+            'by_color': dict(Counter(m.color for m in markers)),
         }
-        
-        for marker in self.markers:
-            # Conta per categoria
-            if marker.category not in stats['by_category']:
-                stats['by_category'][marker.category] = 0
-            stats['by_category'][marker.category] += 1
-            
-            # Conta per colore
-            if marker.color not in stats['by_color']:
-                stats['by_color'][marker.color] = 0
-            stats['by_color'][marker.color] += 1
-        
-        return stats
     
     @property
     def is_modified(self) -> bool:
@@ -457,7 +567,8 @@ class MarkerManager:
             ]
             
             if modified_markers:
-                success = self._db.save_markers_batch(modified_markers)
+                with self._write_lock:
+                    success = self._db.save_markers_batch(modified_markers)
                 if success:
                     self._modified_markers.clear()
                     self._modified = False
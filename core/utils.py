@@ -4,13 +4,59 @@ Funzioni di utilità e helper per SyncView.
 
 import sys
 import shutil
+import time
+import importlib
+from functools import lru_cache
+
+from config.settings import DEPENDENCY_CACHE_TTL_S
+
+# Istante (time.monotonic) dell'ultimo probe memoizzato delle dipendenze
+_dependency_cache_time = 0.0
+
+
+def invalidate_dependency_cache():
+    """Scarta i risultati memoizzati di check_dependencies/generate_dependency_tooltip."""
+    global _dependency_cache_time
+    _check_dependencies_cached.cache_clear()
+    _dependency_tooltip_cached.cache_clear()
+    # Librerie installate ad app aperta: i finder di import devono rileggere le directory
+    importlib.invalidate_caches()
+    _dependency_cache_time = time.monotonic()
+
+
+def is_dependency_cache_stale() -> bool:
+    """True se il risultato memoizzato delle dipendenze è più vecchio di DEPENDENCY_CACHE_TTL_S."""
+    return time.monotonic() - _dependency_cache_time >= DEPENDENCY_CACHE_TTL_S
+
+
+def _expire_dependency_cache():
+    """Invalida la cache delle dipendenze se più vecchia di DEPENDENCY_CACHE_TTL_S."""
+    if is_dependency_cache_stale():
+        invalidate_dependency_cache()
 
 
 def check_dependencies():
     """
     Controlla lo stato delle dipendenze del sistema.
     Ritorna un dizionario con lo stato di ogni dipendenza.
+
+    Il risultato è memoizzato per DEPENDENCY_CACHE_TTL_S secondi (o fino a
+    invalidate_dependency_cache()): il dizionario ritornato è condiviso
+    e va trattato in sola lettura.
     """
+    _expire_dependency_cache()
+    return _check_dependencies_cached()
+
+
+def generate_dependency_tooltip():
+    """Genera il tooltip dinamico per l'indicatore di sistema (memoizzato come check_dependencies)."""
+    _expire_dependency_cache()
+    return _dependency_tooltip_cached()
+
+
+@lru_cache(maxsize=1)
+def _check_dependencies_cached():
+    """Esegue il probe vero e proprio (import delle librerie e ricerca di FFmpeg)."""
     status = {
         'all_ok': True,
         'python_version': '',
@@ -46,9 +92,10 @@ def check_dependencies():
     return status
 
 
-def generate_dependency_tooltip():
-    """Genera il tooltip dinamico per l'indicatore di sistema."""
-    deps = check_dependencies()
+@lru_cache(maxsize=1)
+def _dependency_tooltip_cached():
+    """Costruisce il testo del tooltip a partire dal risultato memoizzato."""
+    deps = _check_dependencies_cached()
     
     if deps['all_ok']:
         tooltip = "✅ TUTTE LE DIPENDENZE INSTALLATE CORRETTAMENTE\n\n"
@@ -93,14 +140,17 @@ def generate_dependency_tooltip():
     return tooltip
 
 
+@lru_cache(maxsize=4096)
+def _format_hms(ms: int) -> str:
+    """Formatta millisecondi interi (>= 0) in HH:MM:SS.mmm con due soli divmod."""
+    hours, rem = divmod(ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    seconds, millis = divmod(rem, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
 def format_time(ms: int) -> str:
     """Formatta millisecondi in HH:MM:SS.mmm."""
     if not isinstance(ms, (int, float)) or ms < 0:
         return "00:00:00.000"
-        
-    total_seconds = ms / 1000
-    hours = int(total_seconds // 3600)
-    minutes = int((total_seconds % 3600) // 60)
-    seconds = int(total_seconds % 60)
-    millis = int(ms % 1000)
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
\ No newline at end of file
+    return _format_hms(int(ms))
@@ -1,12 +1,14 @@
 """
-Worker thread per il caricamento asincrono dei video.
+Worker per il caricamento asincrono dei video.
 Implementa lazy loading per migliorare le performance all'avvio.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QRunnable, QThreadPool, pyqtSignal, QObject
 from pathlib import Path
+import os
 import subprocess
 import json
+from config.settings import VIDEO_LOADER_MAX_THREADS
 from core.logger import logger
 
 
@@ -96,14 +98,27 @@ class VideoInfoWorker(QObject):
         return info
 
 
+class VideoInfoTask(QRunnable):
+    """Task del pool che esegue un VideoInfoWorker fuori dal thread GUI."""
+
+    def __init__(self, worker: VideoInfoWorker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
+
+
 class AsyncVideoLoader:
     """Gestore per il caricamento asincrono dei video.
     
-    Implementa lazy loading con threading per non bloccare l'UI.
+    Implementa lazy loading su un QThreadPool condiviso: i probe dei diversi
+    slot girano in parallelo senza creare/distruggere un QThread per video.
     """
     
     def __init__(self):
-        self.threads = {}
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, min(VIDEO_LOADER_MAX_THREADS, os.cpu_count() or 1)))
         self.workers = {}
     
     def load_video_async(self, video_index: int, video_path: Path, 
@@ -116,50 +131,41 @@ class AsyncVideoLoader:
             on_ready_callback: Funzione da chiamare quando le info sono pronte
             on_error_callback: Funzione da chiamare in caso di errore
         """
-        # Pulisci thread precedente se esiste
-        if video_index in self.threads:
+        # Scarta il risultato di un eventuale caricamento precedente sullo stesso slot
+        if video_index in self.workers:
             self.cleanup_thread(video_index)
         
-        # Crea nuovo worker e thread
-        thread = QThread()
+        # Il worker vive nel thread GUI: i segnali emessi dal pool arrivano in coda
         worker = VideoInfoWorker()
         worker.set_video(video_index, video_path)
-        
-        # Sposta worker nel thread
-        worker.moveToThread(thread)
-        
-        # Connetti segnali
-        thread.started.connect(worker.run)
         worker.info_ready.connect(on_ready_callback)
         worker.error_occurred.connect(on_error_callback)
         
-        # Pulizia automatica al termine
-        worker.info_ready.connect(lambda: self.cleanup_thread(video_index))
-        worker.error_occurred.connect(lambda: self.cleanup_thread(video_index))
-        
-        # Salva riferimenti
-        self.threads[video_index] = thread
+        # Salva riferimento (mantiene vivo il worker fino alla consegna dei segnali)
         self.workers[video_index] = worker
         
-        # Avvia thread
-        thread.start()
+        self.pool.start(VideoInfoTask(worker))
         
         logger.log_user_action(f"Caricamento asincrono avviato", f"Feed-{video_index + 1}: {video_path.name}")
     
     def cleanup_thread(self, video_index: int):
-        """Pulisce un thread terminato."""
-        if video_index in self.threads:
-            thread = self.threads[video_index]
-            thread.quit()
-            thread.wait(2000)  # Aspetta max 2 secondi
-            
-            # Rimuovi riferimenti
-            if video_index in self.threads:
-                del self.threads[video_index]
-            if video_index in self.workers:
-                del self.workers[video_index]
+        """Scollega il worker di uno slot (il risultato in arrivo viene ignorato)."""
+        worker = self.workers.pop(video_index, None)
+        if worker is not None:
+            try:
+                worker.info_ready.disconnect()
+                worker.error_occurred.disconnect()
+            except TypeError:
+                pass
     
-    def cleanup_all(self):
-        """Pulisce tutti i thread attivi."""
-        for index in list(self.threads.keys()):
+    def cleanup_all(self, wait: bool = True):
+        """Pulisce tutti i task attivi.
+        
+        Args:
+            wait: Se False non attende i probe in corso (il chiamante farà il join su self.pool)
+        """
+        for index in list(self.workers.keys()):
             self.cleanup_thread(index)
+        self.pool.clear()
+        if wait:
+            self.pool.waitForDone(2000)  # Aspetta max 2 secondi
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Script di test per verificare il salvataggio dei marker (SQLite/JSON).
+
+Questo script testa:
+1. Copie per-video di un marker globale: ID distinti e sopravvivenza a save/load
+2. Snapshot SQLite isolato dalle modifiche successive sul thread GUI
+3. Uno snapshot più vecchio di uno già scritto non viene scritto
+4. Un salvataggio fallito ripristina i flag di modifica
+5. Salvataggio incrementale serializzato con gli altri writer
+
+Usage:
+    python test_marker_persistence.py
+"""
+
+import json
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+import core.markers as markers_module
+from core.markers import MarkerManager
+
+
+class _CoarseClockDatetime(datetime):
+    """datetime con clock fermo: simula la risoluzione di ~15.6ms di Windows."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 1, 1, 12, 0, 0)
+
+
+def test_per_video_copies_survive_reload():
+    """Test 1: Le copie per-video hanno ID distinti e sopravvivono a save/load."""
+    print("\n" + "="*60)
+    print("TEST 1: Copie per-video di un marker globale")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_path = Path(tmp_dir) / "progetto.json"
+        manager = MarkerManager(project_path, use_database=True)
+        marker = manager.add_marker(5000, description="globale")
+
+        # Tutte le copie vengono create nello stesso "tick" del clock
+        markers_module.datetime = _CoarseClockDatetime
+        try:
+            copies = manager.replace_global_with_per_video(marker.id, [0, 1, 3])
+        finally:
+            markers_module.datetime = datetime
+        ids = [copy.id for copy in copies]
+        print(f"  ID copie: {ids}")
+        assert len(set(ids)) == 3, "Le copie devono avere ID distinti"
+        assert manager.save()
+
+        reloaded = MarkerManager(project_path, use_database=True)
+        assert reloaded.load()
+        video_indices = sorted(m.video_index for m in reloaded.markers)
+        print(f"  Video dopo il reload: {video_indices}")
+        assert video_indices == [0, 1, 3], "Tutte le copie devono sopravvivere al reload"
+
+    print("  ✅ CORRETTO: copie distinte e persistite")
+
+
+def test_db_snapshot_is_isolated():
+    """Test 2: Il job SQLite scrive lo stato al momento di prepare_save."""
+    print("\n" + "="*60)
+    print("TEST 2: Snapshot SQLite isolato")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_path = Path(tmp_dir) / "progetto.json"
+        manager = MarkerManager(project_path, use_database=True)
+        manager.auto_save_enabled = False
+        marker = manager.add_marker(1000, description="prima")
+
+        save_job = manager.prepare_save()
+        # Modifica sul "thread GUI" prima che il job giri sul pool
+        manager.update_marker(marker.id, description="dopo")
+        assert save_job()
+
+        reloaded = MarkerManager(project_path, use_database=True)
+        assert reloaded.load()
+        description = reloaded.markers[0].description
+        print(f"  Descrizione scritta dal job: {description!r}")
+        assert description == "prima", "Il job deve scrivere lo snapshot, non l'oggetto vivo"
+        assert manager.is_modified, "La modifica successiva resta da salvare"
+
+    print("  ✅ CORRETTO: snapshot indipendente dagli oggetti vivi")
+
+
+def test_stale_generation_not_written():
+    """Test 3: Un job più vecchio di uno già scritto viene scartato."""
+    print("\n" + "="*60)
+    print("TEST 3: Snapshot obsoleto non scritto")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_path = Path(tmp_dir) / "progetto.json"
+        manager = MarkerManager(project_path, use_database=False)
+        manager.auto_save_enabled = False
+        manager.add_marker(1000)
+        old_job = manager.prepare_save()
+        manager.add_marker(2000)
+        new_job = manager.prepare_save()
+
+        assert new_job()
+        assert old_job(), "Un job superato conta come riuscito"
+
+        with open(project_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        print(f"  Markers su disco: {len(saved['markers'])}")
+        assert len(saved['markers']) == 2, "Il job vecchio non deve sovrascrivere quello nuovo"
+
+    print("  ✅ CORRETTO: vince lo snapshot più recente")
+
+
+def test_failed_job_restores_flags():
+    """Test 4: mark_unsaved ripristina _modified e gli ID modificati."""
+    print("\n" + "="*60)
+    print("TEST 4: Ripristino flag dopo errore")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Directory inesistente: la scrittura JSON fallisce
+        project_path = Path(tmp_dir) / "mancante" / "progetto.json"
+        manager = MarkerManager(project_path, use_database=False)
+        manager.auto_save_enabled = False
+        marker = manager.add_marker(1000)
+
+        save_job = manager.prepare_save()
+        assert not manager.is_modified
+        assert not save_job(), "La scrittura deve fallire"
+        assert not manager.is_modified, "Il job non tocca i flag (thread del pool)"
+
+        save_job.mark_unsaved()
+        print(f"  is_modified: {manager.is_modified}, ID modificati: {manager._modified_markers}")
+        assert manager.is_modified
+        assert marker.id in manager._modified_markers
+
+        # save() sincrono: il ripristino avviene da solo
+        assert not manager.save()
+        assert manager.is_modified and marker.id in manager._modified_markers
+
+    print("  ✅ CORRETTO: flag ripristinati")
+
+
+def test_incremental_save_uses_write_lock():
+    """Test 5: save_incremental attende il lock condiviso dei writer."""
+    print("\n" + "="*60)
+    print("TEST 5: Salvataggio incrementale serializzato")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        project_path = Path(tmp_dir) / "progetto.json"
+        manager = MarkerManager(project_path, use_database=True)
+        manager.auto_save_enabled = False
+        manager.add_marker(1000)
+
+        result = []
+        with manager._write_lock:
+            worker = threading.Thread(target=lambda: result.append(manager.save_incremental()))
+            worker.start()
+            worker.join(0.2)
+            print(f"  Bloccato mentre un altro writer tiene il lock: {worker.is_alive()}")
+            assert worker.is_alive(), "save_incremental deve attendere il lock"
+        worker.join(5)
+        assert result == [True]
+        assert not manager.is_modified
+
+    print("  ✅ CORRETTO: un solo writer alla volta")
+
+
+def run_all_tests():
+    """Esegue tutti i test e stampa il riepilogo."""
+    tests = [
+        ("Copie per-video persistite", test_per_video_copies_survive_reload),
+        ("Snapshot SQLite isolato", test_db_snapshot_is_isolated),
+        ("Snapshot obsoleto non scritto", test_stale_generation_not_written),
+        ("Ripristino flag dopo errore", test_failed_job_restores_flags),
+        ("Incrementale serializzato", test_incremental_save_uses_write_lock),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ ERRORE: {e}")
+            results.append((name, False))
+
+    print("\n" + "="*60)
+    print("RIEPILOGO TEST")
+    print("="*60)
+
+    passed = sum(1 for _, result in results if result)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status}: {name}")
+    print(f"\nRisultato: {passed}/{len(results)} test passati")
+
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -5,13 +5,21 @@ Modulo per la gestione della modalità debug dell'interfaccia utente.
 from PyQt6.QtWidgets import QWidget, QLayout, QPushButton
 from PyQt6.QtCore import QEvent, QObject, Qt, QRectF
 from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath
-from typing import Set, Dict
+from typing import Set
+import weakref
 
 from core.logger import logger
 
+# Unici eventi gestiti dall'overlay debug: tutti gli altri escono subito dal filtro
+_DEBUG_EVENT_TYPES = frozenset({QEvent.Type.Enter, QEvent.Type.Leave, QEvent.Type.Paint})
+
+
 class DebugLayoutManager:
     """
     Helper per tracciare e gestire i layout per la modalità debug.
+
+    I layout vengono raccolti solo all'attivazione del debug
+    (find_and_register_layouts): nessuna registrazione durante la costruzione della UI.
     """
     _instance = None
     layouts: Set[QLayout]
@@ -49,15 +57,22 @@ class DebugManager(QObject):
         super().__init__(main_window)
         self.main_window = main_window
         self.is_enabled = False
-        self.original_tooltips: Dict[QWidget, str] = {}
+        # Mappa debole: le entry dei widget distrutti spariscono da sole
+        self.original_tooltips: "weakref.WeakKeyDictionary[QWidget, str]" = weakref.WeakKeyDictionary()
 
     def toggle(self):
         """Attiva o disattiva la modalità debug."""
         self.is_enabled = not self.is_enabled
-        if self.is_enabled:
-            self.enable()
-        else:
-            self.disable()
+        # Sospende i repaint durante la modifica in blocco di tooltip ed event filter
+        self.main_window.setUpdatesEnabled(False)
+        try:
+            if self.is_enabled:
+                self.enable()
+            else:
+                self.disable()
+        finally:
+            self.main_window.setUpdatesEnabled(True)
+            self.main_window.update()
 
     def enable(self):
         """Attiva la modalità debug."""
@@ -89,11 +104,11 @@ class DebugManager(QObject):
                 w.setToolTip("")
 
     def _restore_tooltips(self):
-        for widget, tooltip in self.original_tooltips.items():
+        for widget, tooltip in list(self.original_tooltips.items()):
             try:
                 widget.setToolTip(tooltip)
             except RuntimeError:
-                pass
+                pass  # Widget C++ già distrutto ma wrapper Python ancora referenziato
 
     def _install_event_filter_recursive(self, widget: QWidget):
         widgets = [widget] + widget.findChildren(QWidget)
@@ -106,11 +121,14 @@ class DebugManager(QObject):
             w.removeEventFilter(self)
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool: # type: ignore[override]
+        et = event.type()
+        if et not in _DEBUG_EVENT_TYPES:
+            return False
         if not self.is_enabled or not isinstance(watched, QWidget):
             return super().eventFilter(watched, event)
 
         obj: QWidget = watched # Now we can safely use 'obj' as a QWidget
-        if event.type() == QEvent.Type.Enter:
+        if et == QEvent.Type.Enter:
             size = obj.size()
             obj_name = obj.objectName() or obj.__class__.__name__
             nickname = obj.property("nickname")
@@ -125,10 +143,10 @@ class DebugManager(QObject):
                 tooltip += f" | Parent: {parent.objectName() or parent.__class__.__name__}"
             obj.setToolTip(tooltip)
 
-        elif event.type() == QEvent.Type.Leave:
+        elif et == QEvent.Type.Leave:
             obj.setToolTip("")
 
-        elif event.type() == QEvent.Type.Paint:
+        elif et == QEvent.Type.Paint:
             result = super().eventFilter(watched, event)
             painter = QPainter(obj)
 
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QDoubleSpinBox, QDialogButtonBox)
 from PyQt6.QtCore import Qt
 
-from ui.styles import get_main_stylesheet
+from ui.styles import apply_main_stylesheet
 
 
 class FPSDialog(QDialog):
@@ -21,7 +21,7 @@ class FPSDialog(QDialog):
         
     def setup_ui(self):
         """Configura l'interfaccia del dialog."""
-        self.setStyleSheet(get_main_stylesheet())
+        apply_main_stylesheet(self)
         layout = QVBoxLayout(self)
         
         # Titolo
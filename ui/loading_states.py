@@ -225,6 +225,22 @@ class ModalStateManager:
             self.original_enabled_states[id(widget)] = widget.isEnabled()
             widget.setEnabled(False)
     
+    def add_widgets(self, widgets: Sequence[QWidget]) -> None:
+        """Aggiunge allo stato modale in corso widget creati dopo enter_modal_state.
+        
+        Vengono disabilitati subito e ripristinati da exit_modal_state come gli altri.
+        No-op se non si è in stato modale.
+        
+        Args:
+            widgets: Widget da disabilitare
+        """
+        if not self.is_modal():
+            return
+        for widget in widgets:
+            self.original_enabled_states[id(widget)] = widget.isEnabled()
+            widget.setEnabled(False)
+            self.disabled_widgets.append(widget)
+    
     def exit_modal_state(self) -> None:
         """Esce dallo stato modale ripristinando i widget."""
         # Ripristina stato originale
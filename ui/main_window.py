@@ -7,18 +7,21 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QGridLayout, QPushButton, QLabel, QComboBox,
                              QGroupBox, QCheckBox, QMessageBox, QFileDialog, QSizePolicy,
                              QApplication)
-from PyQt6.QtCore import Qt, QTimer, QEvent, QThread
-from PyQt6.QtGui import QKeySequence, QMouseEvent
+from PyQt6.QtCore import (Qt, QTimer, QEvent, QThread, QEventLoop, QDeadlineTimer,
+                          QObject, QThreadPool, pyqtSignal)
+from PyQt6.QtGui import QKeySequence, QMouseEvent, QShortcut
+from PyQt6.QtMultimedia import QMediaPlayer
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Sequence, Tuple
+import logging
+import gc
 import sys
+import time
 
 from ui.video_player import VideoPlayerWidget
 from ui.fps_dialog import FPSDialog
 from ui.timeline_widget import TimelineWidget, TimelineControlWidget
-from ui.simple_export_dialog import SimpleExportDialog
-from core.advanced_exporter import AdvancedVideoExporter
-from ui.styles import get_main_stylesheet
+from ui.styles import get_main_stylesheet, apply_main_stylesheet
 from config.settings import DEFAULT_FPS_OPTIONS, SUPPORTED_VIDEO_FORMATS, THEME_COLORS
 from config.user_paths import user_path_manager
 from core.logger import logger
@@ -26,10 +29,35 @@ from core.sync_manager import SyncManager
 from core.markers import MarkerManager, Marker
 from core.video_loader import AsyncVideoLoader
 from core.frame_cache import FrameCacheManager
-from core.utils import check_dependencies, generate_dependency_tooltip, format_time
+from core.debounce import Debouncer, Throttler
+from core.utils import (check_dependencies, generate_dependency_tooltip, format_time,
+                        is_dependency_cache_stale)
 from ui.loading_states import ModalStateManager
-from ui.debug_manager import DebugManager, DebugLayoutManager
-import gc
+from ui.debug_manager import DebugManager
+
+# Export (concurrent.futures, dialog) importato solo al primo avvio di un export:
+# qui serve solo per le annotazioni di tipo
+if TYPE_CHECKING:
+    from core.advanced_exporter import AdvancedVideoExporter
+
+# Altezze fisse dei controlli individuali (SYNC OFF) usate dal fit video: l'altezza
+# dinamica (.height()) può essere 0 se il layout non è ancora finalizzato
+_CONTROLS_FIXED_HEIGHT = 38  # Pulsanti di controllo individuali
+_TIMELINE_FIXED_HEIGHT = 80  # Timeline individuale
+_CONTROLS_PLUS_TIMELINE = _CONTROLS_FIXED_HEIGHT + _TIMELINE_FIXED_HEIGHT
+
+class DependencyProbe(QObject):
+    """Esegue il controllo delle dipendenze su un thread del pool globale.
+
+    Il primo check importa moviepy/numpy/PIL: fuori dal thread GUI non blocca l'avvio.
+    """
+
+    result_ready = pyqtSignal(str, bool)  # (tooltip, all_ok)
+
+    def run(self):
+        deps = check_dependencies()
+        self.result_ready.emit(generate_dependency_tooltip(), deps['all_ok'])
+
 
 class DraggableTitleBar(QWidget):
     """Widget personalizzato per la title bar con supporto drag."""
@@ -100,6 +128,40 @@ class DraggableTitleBar(QWidget):
 class MainWindow(QMainWindow):
     """Finestra principale dell'applicazione SyncView."""
 
+    # Template per i dettagli del warning di validazione marker (per tipo di problema)
+    # req_before/req_after arrivano già formattati (una volta per dialog)
+    _PROBLEM_TEMPLATES = {
+        'both': "Tempo insufficiente PRIMA ({before:.2f}s disponibili) e DOPO ({after:.2f}s disponibili)",
+        'before': "Tempo insufficiente PRIMA del marker (disponibili: {before:.2f}s, richiesti: {req_before}s)",
+        'after': "Tempo insufficiente DOPO del marker (disponibili: {after:.2f}s, richiesti: {req_after}s)",
+    }
+    # Tipo di problema per codice (prima insufficiente << 1) | dopo insufficiente
+    _ISSUE_BY_CODE = (None, 'after', 'before', 'both')
+    _PROBLEM_ENTRY_TEMPLATE = "• {label} ({feed})\n  Posizione: {pos}\n  {problem}\n"
+
+    # Valori FPS delle voci fisse del combo (es. "24 fps" -> 24.0); "Auto" -> None.
+    # "Personalizzato" è gestito a parte (usa custom_fps)
+    _FPS_VALUES: Dict[str, Optional[float]] = {
+        text: (None if text == "Auto" else float(text.replace(" fps", "")))
+        for text in DEFAULT_FPS_OPTIONS if text != "Personalizzato"
+    }
+
+    # Voci del selettore step frame-by-frame: (etichetta, step in ms)
+    _FRAME_STEP_OPTIONS = (("40ms (25fps)", 40), ("33ms (30fps)", 33), ("100ms", 100), ("200ms", 200))
+
+    # Posizione appena sincronizzata sul master: (posizione_ms, indice_master)
+    force_resync = pyqtSignal(int, int)
+
+    # Esito di un auto-save eseguito sul pool: (job, successo, numero markers), consegnato in coda
+    _autosave_finished = pyqtSignal(object, bool, int)
+
+    # Stato "in riproduzione" risolto una volta (confrontato ad ogni pressione di Spazio)
+    _PLAYING_STATE = QMediaPlayer.PlaybackState.PlayingState
+
+    # Ultimo stato fullscreen/maximized applicato ai controlli dei player
+    # (a livello di classe: changeEvent può arrivare prima della fine di __init__)
+    _last_is_fullscreen = False
+
     def __init__(self):
         super().__init__()
 
@@ -117,6 +179,7 @@ class MainWindow(QMainWindow):
         # Stato dell'applicazione
         self.sync_enabled = True
         self.frame_mode_enabled = False
+        self._frame_step_ms = self._FRAME_STEP_OPTIONS[0][1]  # Aggiornato dal selettore step
         self.custom_fps = 25.0
         self.focused_video_index = 0
         self.video_players = []
@@ -148,46 +211,101 @@ class MainWindow(QMainWindow):
         # Opzione auto-load
         self.auto_load_enabled = True  # Può essere resa configurabile
 
-        # Timer aggiornamento timeline
-        self.timeline_update_timer = QTimer()
-        self.timeline_update_timer.setInterval(100)  # Aggiorna ogni 100ms
-        self.timeline_update_timer.timeout.connect(self.update_timeline_position)
-        self.timeline_update_timer.start()
+        # La timeline globale è aggiornata dai segnali position/duration dei player
+        # (nessun timer di polling: zero wakeup quando i video sono fermi).
+        # Gli aggiornamenti ravvicinati vengono accorpati a max ~60fps.
+        self._timeline_throttler = Throttler(16, self)
+
+        # Refresh UI accorpato per i cambi di stato caricamento
+        # (durante l'auto-load i 4 player segnalano quasi in contemporanea)
+        self._load_state_debouncer = Debouncer(16, self)
+
+        # Step frame accumulati dall'auto-repeat dei tasti freccia: un solo seek ogni 16ms
+        self._pending_step = 0
+        self._step_flush_timer = QTimer(self)
+        self._step_flush_timer.setSingleShot(True)
+        self._step_flush_timer.setInterval(16)
+        self._step_flush_timer.timeout.connect(self._flush_step)
 
         # Timer auto-save markers (ogni 30 secondi)
         self.marker_autosave_timer = QTimer()
         self.marker_autosave_timer.setInterval(30000)  # 30 secondi
+        # Nessuna precisione al ms richiesta: l'OS può accorpare il wakeup con altri timer
+        self.marker_autosave_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.marker_autosave_timer.timeout.connect(self.autosave_markers)
         self.marker_autosave_timer.start()
+        # Auto-save in corso sul thread pool (evita scritture sovrapposte sullo stesso file)
+        self._autosave_in_flight = False
+        self._autosave_finished.connect(self._on_autosave_finished)
         
         self.export_thread: Optional[QThread] = None
-        self.exporter: Optional[AdvancedVideoExporter] = None
-
-        # Setup UI
-        self.setup_ui()
+        self.exporter: Optional["AdvancedVideoExporter"] = None
+        # Ultimo log di progresso export (time.monotonic), per limitarne la frequenza
+        self._last_progress_log_time = 0.0
+        # Ultimo aggiornamento dello status indicator durante l'export (time.monotonic)
+        self._last_status_update_time = 0.0
+
+        # Stato dipendenze da (ri)calcolare: all'avvio e, scaduta la cache, al ritorno sulla finestra
+        self._dependency_status_dirty = True
+        self._dependency_probe_pending = False
+
+        # Slot ancora in caricamento dall'auto-load (None = nessun auto-load in corso)
+        self._autoload_pending: Optional[set] = None
+        # Player con video caricato, nell'ordine della griglia (aggiornata in on_video_load_state_changed)
+        self._loaded_players: List[VideoPlayerWidget] = []
+        # Flag di caricamento per slot (stesso aggiornamento di _loaded_players)
+        self._loaded_flags: List[bool] = [False] * 4
+        # Stato del fit video differito (vedi fit_all_videos/_finalize_fit)
+        self._fit_in_progress = False
+        self._pending_fit = []
+        # True mentre il combo FPS viene modificato dal codice (on_fps_changed lo ignora)
+        self._in_fps_update = False
+        # FPS target del combo (None = Auto), aggiornato solo quando la selezione cambia
+        self._target_fps: Optional[float] = None
+        # Refresh delle timeline dopo modifiche ai marker già accodato (vedi _schedule_marker_refresh)
+        self._marker_refresh_pending = False
+
+        # QMessageBox riutilizzati per i dialog ricorrenti dell'export (creati al primo uso)
+        self._warning_msgbox: Optional[QMessageBox] = None
+        self._export_result_msgbox: Optional[QMessageBox] = None
+
+        # Setup UI (GC ciclico sospeso: evita passate di raccolta sul grafo di
+        # wrapper Qt appena creati, tutti ancora vivi)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.setup_ui()
+        finally:
+            # Non riattivare il GC se il processo chiamante lo aveva già disattivato
+            if gc_was_enabled:
+                gc.enable()
         self.setup_shortcuts()
 
         # Imposta visibilità iniziale dei controlli (sincronizzazione attiva di default)
-        # I controlli globali partono nascosti, si mostrano solo con sincronizzazione attiva
-        # Verrà gestito dal primo toggle_sync chiamato all'avvio
+        # e avvia l'auto-load: un unico callback differito all'avvio dell'event loop
+        QTimer.singleShot(0, self._deferred_startup)
 
         # Auto-load video dalle cartelle Feed (opzionale)
-        # Aumentato il delay per dare tempo all'UI di inizializzarsi completamente
+        # Il probing gira sul pool dell'AsyncVideoLoader: basta attendere l'avvio dell'event loop
         if self.auto_load_enabled:
-            QTimer.singleShot(1000, self.auto_load_videos)
-            logger.log_user_action("Auto-load abilitato", "Caricamento video in 1 secondo")
+            logger.log_user_action("Auto-load abilitato", "Caricamento video all'avvio dell'event loop")
         else:
             logger.log_user_action("Auto-load disabilitato", "I video vanno caricati manualmente")
 
         # Inizializza i controlli in modalità windowed (compatta) all'avvio
-        QTimer.singleShot(100, lambda: self._initialize_window_mode())
+        QTimer.singleShot(100, self._initialize_window_mode)
 
         logger.log_user_action("Finestra principale creata", "Fase 1 avviata")
 
     def setup_ui(self):
         """Configura l'interfaccia utente."""
-        # Applica stile globale
-        self.setStyleSheet(get_main_stylesheet())
+        # Applica stile globale a livello applicazione, solo se non è già attivo
+        app = QApplication.instance()
+        stylesheet = get_main_stylesheet()
+        if app is None:
+            self.setStyleSheet(stylesheet)
+        elif app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
         central_widget = QWidget()
         central_widget.setProperty("nickname", "Widget Centrale Principale")
@@ -196,7 +314,6 @@ class MainWindow(QMainWindow):
         # Layout principale con margini per il bordo
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(2, 2, 2, 2)  # Spazio per il bordo giallo
-        DebugLayoutManager().add_layout(main_layout)
         main_layout.setSpacing(0)
 
         # Stile del central widget con bordo
@@ -209,7 +326,6 @@ class MainWindow(QMainWindow):
 
         inner_layout = QVBoxLayout(inner_container)
         inner_layout.setContentsMargins(0, 0, 0, 0)
-        DebugLayoutManager().add_layout(inner_layout)
         inner_layout.setSpacing(0)
 
         # Barra del titolo personalizzata
@@ -222,7 +338,6 @@ class MainWindow(QMainWindow):
         content_layout = QHBoxLayout(content_widget)
         content_layout.setContentsMargins(10, 10, 10, 10)
         content_layout.setSpacing(10)
-        DebugLayoutManager().add_layout(content_layout)
 
         # === SIDEBAR SINISTRA CON CONTROLLI (25% della larghezza) ===
         sidebar_widget = QWidget()
@@ -230,17 +345,16 @@ class MainWindow(QMainWindow):
         sidebar_layout = QVBoxLayout(sidebar_widget)
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
         sidebar_layout.setSpacing(10)
-        DebugLayoutManager().add_layout(sidebar_layout)
         # Rimosso setFixedWidth per usare stretch factor
 
         # Controlli globali in sidebar
         controls = self.create_global_controls()
         sidebar_layout.addWidget(controls)
 
-        # Controlli frame-by-frame in sidebar (nascosti inizialmente)
-        self.frame_controls_widget = self.create_frame_controls()
-        self.frame_controls_widget.hide()
-        sidebar_layout.addWidget(self.frame_controls_widget)
+        # Controlli frame-by-frame in sidebar: creati alla prima attivazione della modalità frame
+        self.frame_controls_widget: Optional[QWidget] = None
+        self._sidebar_layout = sidebar_layout
+        self._frame_controls_index = sidebar_layout.count()
 
         # Timeline controls in sidebar
         self.timeline_controls = TimelineControlWidget()
@@ -262,7 +376,6 @@ class MainWindow(QMainWindow):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(10)
-        DebugLayoutManager().add_layout(right_layout)
 
         # Griglia video 2x2 - ora occupa più spazio verticale
         video_grid = self.create_video_grid()
@@ -286,6 +399,12 @@ class MainWindow(QMainWindow):
         # Aggiungi container interno al layout principale (con bordo)
         main_layout.addWidget(inner_container)
 
+        # Widget da disabilitare durante l'export (calcolati una sola volta, la griglia è fissa)
+        self._export_disable_widgets: List[QWidget] = [
+            self.timeline_controls,
+            *(w for p in self.video_players for w in (p.load_button, p.remove_button)),
+        ]
+
     def create_custom_title_bar(self):
         """Crea una barra del titolo personalizzata."""
         title_bar = DraggableTitleBar(self)
@@ -296,7 +415,6 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout(title_bar)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        DebugLayoutManager().add_layout(layout)
 
         # Icona e titolo (QLabel normale - event filter gestirà il drag)
         title_label = QLabel("⚡ SYNCVIEW - TACTICAL MULTI-VIDEO ANALYSIS")
@@ -307,7 +425,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(title_label)
 
         # Spazio draggable centrale (QWidget normale - event filter gestirà il drag)
-        from PyQt6.QtWidgets import QSizePolicy
         drag_spacer = QWidget()
         drag_spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         drag_spacer.setProperty("nickname", "Spazio per Drag")
@@ -328,8 +445,7 @@ class MainWindow(QMainWindow):
         self.status_indicator = QLabel("● SISTEMA OPERATIVO")
         self.status_indicator.setProperty("nickname", "Indicatore di Stato Sistema")
         self.status_indicator.setObjectName("statusIndicator")
-        # Imposta tooltip dinamico con stato dipendenze
-        self.status_indicator.setToolTip(generate_dependency_tooltip())
+        # Il tooltip dinamico con stato dipendenze viene impostato in showEvent
         # Installa event filter della title bar su questo label
         self.status_indicator.installEventFilter(title_bar)
         layout.addWidget(self.status_indicator)
@@ -368,7 +484,6 @@ class MainWindow(QMainWindow):
         """Crea la griglia 2x2 dei player video."""
         grid = QGridLayout()
         grid.setSpacing(10)
-        DebugLayoutManager().add_layout(grid)
         
         # Imposta stretch uniforme per le colonne (50% ciascuna)
         grid.setColumnStretch(0, 1)
@@ -390,6 +505,10 @@ class MainWindow(QMainWindow):
             # Imposta l'async loader su ogni player
             player.set_async_loader(self.async_loader)
 
+            # Sync manager condiviso: serve al player per riallinearsi su force_resync
+            player.set_sync_manager(self.sync_manager)
+            self.force_resync.connect(player.on_force_resync)
+
             # Collega il segnale di seek dell'utente per la sincronizzazione (SYNC OFF)
             player.user_seeked.connect(self.on_video_seeked)
 
@@ -405,10 +524,17 @@ class MainWindow(QMainWindow):
             # Collega il segnale di cambio stato caricamento per aggiornare visibilità controlli
             player.video_load_state_changed.connect(self.on_video_load_state_changed)
 
+            # Aggiornamento event-driven della timeline globale
+            player.position_changed.connect(lambda _pos, idx=i: self.on_player_timing_changed(idx))
+            player.duration_changed.connect(lambda _dur, idx=i: self.on_player_timing_changed(idx))
+
             row = i // 2
             col = i % 2
             grid.addWidget(player, row, col)
 
+        # Timeline individuale -> indice del video (per identificare il sender dei segnali marker)
+        self._timeline_to_index = {p.timeline_widget: p.video_index for p in self.video_players}
+
         return grid
 
     def create_global_controls(self):
@@ -418,7 +544,6 @@ class MainWindow(QMainWindow):
         container_layout = QVBoxLayout(container_widget)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(10)
-        DebugLayoutManager().add_layout(container_layout)
 
         # === CONTROLLI RIPRODUZIONE ===
         self.playback_group = QGroupBox("Riproduzione")
@@ -432,7 +557,6 @@ class MainWindow(QMainWindow):
         play_pause_layout = QVBoxLayout(self.play_pause_container)
         play_pause_layout.setContentsMargins(0, 0, 0, 0)
         play_pause_layout.setSpacing(0)
-        DebugLayoutManager().add_layout(play_pause_layout)
         
         self.play_pause_button = QPushButton("▶ PLAY")
         self.play_pause_button.setProperty("nickname", "Pulsante Play/Pausa Globale")
@@ -449,7 +573,6 @@ class MainWindow(QMainWindow):
         nav_normal_layout = QHBoxLayout(self.nav_normal_container)
         nav_normal_layout.setContentsMargins(0, 0, 0, 0)
         nav_normal_layout.setSpacing(5)
-        DebugLayoutManager().add_layout(nav_normal_layout)
         
         self.to_start_button = QPushButton("⏮")
         self.to_start_button.setProperty("nickname", "Pulsante Vai a Inizio")
@@ -470,7 +593,6 @@ class MainWindow(QMainWindow):
         nav_compact_layout = QHBoxLayout(self.nav_compact_container)
         nav_compact_layout.setContentsMargins(0, 0, 0, 0)
         nav_compact_layout.setSpacing(5)
-        DebugLayoutManager().add_layout(nav_compact_layout)
         
         self.to_start_button_compact = QPushButton("⏮")
         self.to_start_button_compact.setProperty("nickname", "Pulsante Vai a Inizio (Compatto)")
@@ -514,14 +636,12 @@ class MainWindow(QMainWindow):
         settings_group.setProperty("nickname", "Gruppo Impostazioni")
         settings_layout = QVBoxLayout(settings_group)
         settings_layout.setSpacing(8)
-        DebugLayoutManager().add_layout(settings_layout)
 
         # FPS selector (salvato come attributo per nascondere in frame mode)
         self.fps_selector_widget = QWidget()
         self.fps_selector_widget.setProperty("nickname", "Contenitore Selettore FPS")
         fps_layout = QVBoxLayout(self.fps_selector_widget)
         fps_layout.setContentsMargins(0, 0, 0, 0)
-        DebugLayoutManager().add_layout(fps_layout)
         fps_label = QLabel("FPS:")
         fps_label.setProperty("nickname", "Etichetta 'FPS:'") # Stile spostato in styles.py
         fps_layout.addWidget(fps_label)
@@ -543,9 +663,6 @@ class MainWindow(QMainWindow):
         self.sync_checkbox.stateChanged.connect(self.toggle_sync)
         settings_layout.addWidget(self.sync_checkbox)
 
-        # Inizializza la visibilità dei controlli in base allo stato della checkbox
-        QTimer.singleShot(0, lambda: self.toggle_sync(Qt.CheckState.Checked.value))
-
         # Resync button (visibile solo quando sync è off)
         self.resync_button = QPushButton("🔄 SINCRONIZZA")
         self.resync_button.setProperty("nickname", "Pulsante Risincronizza")
@@ -571,6 +688,22 @@ class MainWindow(QMainWindow):
 
         return container_widget
 
+    def _ensure_frame_controls(self) -> QWidget:
+        """Crea i controlli frame-by-frame al primo utilizzo e li inserisce nella sidebar."""
+        if self.frame_controls_widget is None:
+            self.frame_controls_widget = self.create_frame_controls()
+            self._sidebar_layout.insertWidget(self._frame_controls_index, self.frame_controls_widget)
+            step_buttons = (
+                self.back_10_frames_btn,
+                self.back_1_frame_btn,
+                self.forward_1_frame_btn,
+                self.forward_10_frames_btn,
+            )
+            self._export_disable_widgets.extend(step_buttons)
+            # Creati durante un export: la lista del modal manager è già stata catturata
+            self.modal_manager.add_widgets(step_buttons)
+        return self.frame_controls_widget
+
     def create_frame_controls(self):
         """Crea i controlli per la modalità frame-by-frame (sidebar)."""
         group_box = QGroupBox("🎞 FRAME-BY-FRAME")
@@ -578,7 +711,6 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(group_box)
         layout.setContentsMargins(10, 15, 10, 10)
         layout.setSpacing(8)
-        DebugLayoutManager().add_layout(layout)
 
         # Info label
         info_label = QLabel("Modalità Frame Attiva")
@@ -588,27 +720,25 @@ class MainWindow(QMainWindow):
 
         # Frame step selector
         step_layout = QHBoxLayout()
-        DebugLayoutManager().add_layout(step_layout)
         step_label = QLabel("Step:")
         step_label.setProperty("nickname", "Etichetta 'Step:'")
         step_layout.addWidget(step_label)
 
         self.frame_step_combo = QComboBox()
-        self.frame_step_combo.addItems(["40ms (25fps)", "33ms (30fps)", "100ms", "200ms"])
+        self.frame_step_combo.addItems([label for label, _ in self._FRAME_STEP_OPTIONS])
         self.frame_step_combo.setProperty("nickname", "Selettore Step Frame")
         self.frame_step_combo.setCurrentIndex(0)
         self.frame_step_combo.setToolTip("Dimensione dello step per frame")
+        self.frame_step_combo.currentIndexChanged.connect(self._on_frame_step_changed)
         step_layout.addWidget(self.frame_step_combo)
         layout.addLayout(step_layout)
 
         # Pulsanti grandi: -10, -1, +1, +10
         buttons_layout = QVBoxLayout()
-        DebugLayoutManager().add_layout(buttons_layout)
         buttons_layout.setSpacing(5)
 
         # Riga 1: -10 e +10
         row1 = QHBoxLayout()
-        DebugLayoutManager().add_layout(row1)
         self.back_10_frames_btn = QPushButton("◀◀ -10")
         self.back_10_frames_btn.setProperty("nickname", "Pulsante -10 Frame")
         self.back_10_frames_btn.setToolTip("Torna indietro di 10 frame (Shift + ←)")
@@ -624,7 +754,6 @@ class MainWindow(QMainWindow):
 
         # Riga 2: -1 e +1
         row2 = QHBoxLayout()
-        DebugLayoutManager().add_layout(row2)
         self.back_1_frame_btn = QPushButton("◀ -1")
         self.back_1_frame_btn.setProperty("nickname", "Pulsante -1 Frame")
         self.back_1_frame_btn.setToolTip("Torna indietro di 1 frame (←)")
@@ -643,88 +772,50 @@ class MainWindow(QMainWindow):
         return group_box
 
     def setup_shortcuts(self):
-        """Configura le scorciatoie da tastiera."""
-        # Spazio per Play/Pause
-        from PyQt6.QtGui import QShortcut
-
-        play_pause_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
-        play_pause_shortcut.activated.connect(self.toggle_play_pause)
-
-        # Ctrl+O per caricare video
-        load_shortcut = QShortcut(QKeySequence("Ctrl+O"), self)
-        load_shortcut.activated.connect(self.load_videos_dialog)
-
-        # F1 per guida
-        help_shortcut = QShortcut(QKeySequence("F1"), self)
-        help_shortcut.activated.connect(self.show_help)
-
-        # Ctrl+S per toggle sync
-        sync_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
-        sync_shortcut.activated.connect(lambda: self.sync_checkbox.toggle())
-
-        # Ctrl+F per toggle frame mode
-        frame_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
-        frame_shortcut.activated.connect(lambda: self.frame_mode_checkbox.toggle())
-        
-        # Ctrl+R per fit video
-        fit_shortcut = QShortcut(QKeySequence("Ctrl+R"), self)
-        fit_shortcut.activated.connect(self.fit_all_videos)
-
-        # Rimosso duplicato per Spazio
-        # play_pause_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
-        # play_pause_shortcut.activated.connect(self.toggle_play_pause)
-
-        # Home/End per inizio/fine
-        home_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Home), self)
-        home_shortcut.activated.connect(self.global_to_start)
-
-        end_shortcut = QShortcut(QKeySequence(Qt.Key.Key_End), self)
-        end_shortcut.activated.connect(self.global_to_end)
-
-        # M per audio master
-        mute_shortcut = QShortcut(QKeySequence("M"), self)
-        mute_shortcut.activated.connect(lambda: self.master_mute_button.click())
-
-        # Frecce sinistra/destra per frame-by-frame (quando modalità frame è attiva)
-        left_arrow_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Left), self)
-        left_arrow_shortcut.activated.connect(self.on_left_arrow_pressed)
-
-        right_arrow_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Right), self)
-        right_arrow_shortcut.activated.connect(self.on_right_arrow_pressed)
-
-        # Shift + Frecce per 10 frame
-        shift_left_shortcut = QShortcut(QKeySequence("Shift+Left"), self)
-        shift_left_shortcut.activated.connect(lambda: self.step_frames(-10) if self.frame_mode_enabled else None)
-
-        shift_right_shortcut = QShortcut(QKeySequence("Shift+Right"), self)
-        shift_right_shortcut.activated.connect(lambda: self.step_frames(10) if self.frame_mode_enabled else None)
-
-        # ===== MARKER SHORTCUTS =====
-        # Ctrl+M per aggiungere marker
-        add_marker_shortcut = QShortcut(QKeySequence("Ctrl+M"), self)
-        add_marker_shortcut.activated.connect(self.add_marker_at_current_position)
-
-        # P per marker precedente
-        prev_marker_shortcut = QShortcut(QKeySequence("P"), self)
-        prev_marker_shortcut.activated.connect(self.go_to_previous_marker)
-
-        # N per marker successivo
-        next_marker_shortcut = QShortcut(QKeySequence("N"), self)
-        next_marker_shortcut.activated.connect(self.go_to_next_marker)
-
-        # Ctrl+E per export video da markers
-        export_markers_shortcut = QShortcut(QKeySequence("Ctrl+E"), self)
-        export_markers_shortcut.activated.connect(self.start_export_process)
-        
-        # Ctrl+0 per reset zoom su tutti i video
-        reset_zoom_shortcut = QShortcut(QKeySequence("Ctrl+0"), self)
-        reset_zoom_shortcut.activated.connect(self.reset_all_zoom)
+        """Configura le scorciatoie da tastiera (tabella sequenza -> slot, senza lambda)."""
+        # Scorciatoie di riproduzione/seek: disattivate durante export e auto-load
+        playback_shortcuts = (
+            (Qt.Key.Key_Space, self.toggle_play_pause),                  # Play/Pausa
+            (Qt.Key.Key_Home, self.global_to_start),                      # Vai a inizio
+            (Qt.Key.Key_End, self.global_to_end),                         # Vai a fine
+            # Frecce (1 frame) e Shift + Frecce (10 frame), attive solo in modalità frame
+            (Qt.Key.Key_Left, self.on_left_arrow_pressed),
+            (Qt.Key.Key_Right, self.on_right_arrow_pressed),
+            ("Shift+Left", self.on_shift_left_pressed),
+            ("Shift+Right", self.on_shift_right_pressed),
+        )
+        shortcuts = (
+            ("Ctrl+O", self.load_videos_dialog),                          # Carica video
+            ("F1", self.show_help),                                       # Guida
+            ("Ctrl+S", self.sync_checkbox.toggle),                        # Toggle sync
+            ("Ctrl+F", self.frame_mode_checkbox.toggle),                  # Toggle frame mode
+            ("Ctrl+R", self.fit_all_videos),                              # Fit video
+            ("M", self.master_mute_button.click),                         # Audio master
+            # ===== MARKER SHORTCUTS =====
+            ("Ctrl+M", self.add_marker_at_current_position),              # Aggiungi marker
+            ("P", self.go_to_previous_marker),                            # Marker precedente
+            ("N", self.go_to_next_marker),                                # Marker successivo
+            ("Ctrl+E", self.start_export_process),                        # Export da markers
+            ("Ctrl+0", self.reset_all_zoom),                              # Reset zoom su tutti i video
+        )
+        self._playback_shortcuts: List[QShortcut] = []
+        for key_sequence, slot in playback_shortcuts:
+            shortcut = QShortcut(QKeySequence(key_sequence), self)
+            shortcut.activated.connect(slot)
+            self._playback_shortcuts.append(shortcut)
+        for key_sequence, slot in shortcuts:
+            QShortcut(QKeySequence(key_sequence), self).activated.connect(slot)
+
+    def _update_playback_shortcuts(self):
+        """Abilita le scorciatoie di riproduzione solo fuori da export e auto-load."""
+        enabled = self._autoload_pending is None and not self.modal_manager.is_modal()
+        for shortcut in self._playback_shortcuts:
+            shortcut.setEnabled(enabled)
 
     def reset_all_zoom(self):
         """Resetta lo zoom e pan di tutti i video player."""
-        for player in self.video_players:
-            if player.is_loaded:
-                player.reset_zoom()
+        for player in self._loaded_players:
+            player.reset_zoom()
         logger.log_user_action("Zoom reset globale", "Tutti i video resettati a 100%")
 
     def on_left_arrow_pressed(self):
@@ -737,27 +828,54 @@ class MainWindow(QMainWindow):
         if self.frame_mode_enabled:
             self.step_frames(1)
 
+    def on_shift_left_pressed(self):
+        """Gestisce Shift + freccia sinistra (indietro di 10 frame)."""
+        if self.frame_mode_enabled:
+            self.step_frames(-10)
+
+    def on_shift_right_pressed(self):
+        """Gestisce Shift + freccia destra (avanti di 10 frame)."""
+        if self.frame_mode_enabled:
+            self.step_frames(10)
+
     def update_dependency_status(self):
-        """Aggiorna il tooltip del sistema con lo stato delle dipendenze."""
-        self.status_indicator.setToolTip(generate_dependency_tooltip())
+        """Aggiorna il tooltip del sistema con lo stato delle dipendenze.
         
-        # Aggiorna anche il colore in base allo stato (tramite property per lo stylesheet)
-        deps = check_dependencies()
-        if deps['all_ok']:
-            self.status_indicator.setProperty("status", "ok")
-        else:
-            self.status_indicator.setProperty("status", "warning")
+        No-op se lo stato non è stato invalidato (_dependency_status_dirty).
+        """
+        if not self._dependency_status_dirty:
+            return
+        self._dependency_status_dirty = False
+        self._dependency_probe_pending = True
+        self.status_indicator.setToolTip("● VERIFICA DIPENDENZE…")
+
+        # Il probe (memoizzato in core.utils) gira sul pool globale; il risultato arriva in coda
+        self._dependency_probe = DependencyProbe()
+        self._dependency_probe.result_ready.connect(self._apply_dependency_status)
+        QThreadPool.globalInstance().start(self._dependency_probe.run)
+
+    def _apply_dependency_status(self, tooltip: str, all_ok: bool):
+        """Applica al status indicator il risultato del controllo dipendenze."""
+        self._dependency_probe_pending = False
+        self.status_indicator.setToolTip(tooltip)
+
+        # Aggiorna anche il colore in base allo stato (tramite property per lo stylesheet),
+        # senza sovrascrivere uno stato transitorio (caricamento, export) già impostato
+        if self.status_indicator.property("status") in (None, "ok", "warning"):
+            self._set_status_indicator(None, "ok" if all_ok else "warning")
 
     def auto_load_videos(self):
         """Carica automaticamente i video dalle ultime path utilizzate."""
         logger.log_user_action("Auto-caricamento video", "Tentativo di carica da ultime path usate")
 
-        # Log di tutti i percorsi salvati (prima del filtro)
-        all_paths = [user_path_manager.get_video_path(i) for i in range(4)]
-        logger.log_user_action(
-            "Percorsi salvati trovati",
-            f"Slot 0: {all_paths[0]}, Slot 1: {all_paths[1]}, Slot 2: {all_paths[2]}, Slot 3: {all_paths[3]}"
-        )
+        # Log di tutti i percorsi salvati (prima del filtro), solo se il dettaglio finisce nel log
+        if logger.is_debug_enabled():
+            all_paths = user_path_manager.get_all_video_paths()
+            logger.log_user_action(
+                "Percorsi salvati trovati",
+                ", ".join(f"Slot {i}: {path}" for i, path in enumerate(all_paths)),
+                level=logging.DEBUG
+            )
 
         # Ottieni le path valide (che esistono ancora)
         valid_paths = user_path_manager.get_valid_video_paths()
@@ -765,8 +883,7 @@ class MainWindow(QMainWindow):
         if not valid_paths:
             logger.log_user_action("Nessun video da auto-caricare", "Nessun file video trovato o tutti i percorsi sono null")
             # Mostra un messaggio informativo all'utente
-            self.status_indicator.setText("● PRONTO - NESSUN VIDEO")
-            self.status_indicator.setProperty("status", "ready")
+            self._set_status_indicator("● PRONTO - NESSUN VIDEO", "ready")
             return
         
         logger.log_user_action(
@@ -774,6 +891,8 @@ class MainWindow(QMainWindow):
             f"Slot: {list(valid_paths.keys())}"
         )
         
+        self._autoload_pending = set(valid_paths)
+        self._update_playback_shortcuts()
         loaded_count = 0
         for index, video_path in valid_paths.items():
             # Carica il video in modo asincrono
@@ -785,100 +904,81 @@ class MainWindow(QMainWindow):
             )
         
         # Aggiorna status indicator con info sul caricamento
-        self.status_indicator.setText(f"● CARICAMENTO {loaded_count} VIDEO…")
-        self.status_indicator.setProperty("status", "loading")
+        self._set_status_indicator(f"● CARICAMENTO {loaded_count} VIDEO…", "loading")
         
-        # Dopo 2 secondi, reimposta lo status normale
-        QTimer.singleShot(2000, lambda: self._reset_status_after_autoload(loaded_count))
+        # Lo status torna normale appena tutti i video sono pronti (probe in parallelo sul pool
+        # dell'AsyncVideoLoader); dopo 2 secondi comunque, anche se qualche caricamento è fallito
+        QTimer.singleShot(2000, Qt.TimerType.CoarseTimer, self._reset_status_after_autoload)
         
         logger.log_user_action(f"Auto-load completato", f"{loaded_count} video in caricamento")
 
-    def _reset_status_after_autoload(self, loaded_count: int):
-        """Reimposta lo status indicator dopo il caricamento automatico."""
-        self.status_indicator.setText("● SISTEMA PRONTO")
-        self.status_indicator.setProperty("status", "ok")
+    def _reset_status_after_autoload(self):
+        """Reimposta lo status indicator dopo il caricamento automatico (una sola volta)."""
+        if self._autoload_pending is None:
+            return
+        self._autoload_pending = None
+        self._update_playback_shortcuts()
+        self._set_status_indicator("● SISTEMA PRONTO", "ok")
+        loaded_count = len(self._loaded_players)
         logger.log_user_action(f"Auto-load status reset", f"{loaded_count} video caricati")
 
     def load_videos_dialog(self):
         """Apre un dialogo per caricare video manualmente."""
         file_filter = "Video Files (" + " ".join(f"*{fmt}" for fmt in SUPPORTED_VIDEO_FORMATS) + ")"
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Seleziona video da caricare",
-            str(Path.home()),
-            file_filter
-        )
-
-        if files:
-            for i, file_path in enumerate(files[:4]):  # Max 4 video
-                self.video_players[i].load_video(file_path)
+        # Dialog window-modal con open(): nessun event loop annidato, il playback continua
+        dialog = QFileDialog(self, "Seleziona video da caricare", str(Path.home()), file_filter)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.filesSelected.connect(self._on_video_files_selected)
+        dialog.open()
+
+    def _on_video_files_selected(self, files: List[str]):
+        """Carica i video scelti nel dialog (max 4, in ordine di slot)."""
+        for i, file_path in enumerate(files[:4]):  # Max 4 video
+            self.video_players[i].load_video(file_path)
 
     # Controlli globali
     def toggle_play_pause_global(self):
         """Alterna tra play e pausa per tutti i video."""
         # Verifica lo stato del primo player caricato
-        is_playing = False
-        for player in self.video_players:
-            if player.is_loaded:
-                from PyQt6.QtMultimedia import QMediaPlayer
-                if player.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-                    is_playing = True
-                break
+        loaded_players = self._loaded_players
+        is_playing = bool(loaded_players) and loaded_players[0].media_player.playbackState() == self._PLAYING_STATE
 
         if is_playing:
             # Pausa tutti
             logger.log_user_action("Pausa globale")
-            for player in self.video_players:
-                if player.is_loaded:
-                    player.pause()
+            for player in self._loaded_players:
+                player.pause()
+            # Play e pausa condividono lo stile (#playButton): basta cambiare il testo, nessun re-polish
             self.play_pause_button.setText("▶ PLAY")
-            self.play_pause_button.setObjectName("playButton")
             self.play_pause_button_compact.setText("▶")
-            self.play_pause_button_compact.setObjectName("compactPlayButton")
         else:
             # Play tutti
             logger.log_user_action("Play globale")
-            for player in self.video_players:
-                if player.is_loaded:
-                    # Questo previene che una selezione FPS precedente (ora scollegata)
-                    # rimanga attiva se il rate era diverso da 1.0
-                    player.set_playback_rate(1.0)
-                    player.play()
+            for player in self._loaded_players:
+                # Questo previene che una selezione FPS precedente (ora scollegata)
+                # rimanga attiva se il rate era diverso da 1.0
+                player.set_playback_rate(1.0)
+                player.play()
             self.play_pause_button.setText("⏸ PAUSA")
-            self.play_pause_button.setObjectName("pauseButton")
             self.play_pause_button_compact.setText("⏸")
-            self.play_pause_button_compact.setObjectName("compactPauseButton")
             # Aggiorna anche current_playback_rate interno
             self.current_playback_rate = 1.0
-            # Resetta il combo box a "Auto" senza emettere segnale
-            self.fps_combo.blockSignals(True)
-            self.fps_combo.setCurrentText("Auto")
-            self.fps_combo.blockSignals(False)
-
-        # Riapplica lo stile a entrambi i pulsanti
-        style = self.play_pause_button.style()
-        if style:
-            style.unpolish(self.play_pause_button)  # type: ignore[attr-defined]
-            style.polish(self.play_pause_button)  # type: ignore[attr-defined]
-        style_compact = self.play_pause_button_compact.style()
-        if style_compact:
-            style_compact.unpolish(self.play_pause_button_compact)  # type: ignore[attr-defined]
-            style_compact.polish(self.play_pause_button_compact)  # type: ignore[attr-defined]
+            # Resetta il combo box a "Auto" senza riapplicare i playback rate
+            self._reset_fps_combo_to_auto()
 
     def global_to_start(self):
         """Porta tutti i video all'inizio."""
         logger.log_user_action("Vai all'inizio")
-        for player in self.video_players:
-            if player.is_loaded:
-                player.seek_position(0)
+        for player in self._loaded_players:
+            player.seek_position(0)
 
     def global_to_end(self):
         """Porta tutti i video alla fine."""
         logger.log_user_action("Vai alla fine")
-        for player in self.video_players:
-            if player.is_loaded:
-                duration = player.get_duration()
-                player.seek_position(duration)
+        for player in self._loaded_players:
+            duration = player.get_duration()
+            player.seek_position(duration)
 
     def toggle_play_pause(self):
         """Alterna tra play e pausa (chiamata da scorciatoia)."""
@@ -889,9 +989,8 @@ class MainWindow(QMainWindow):
         is_muted = self.master_mute_button.isChecked()
         logger.log_user_action("Audio master", "Muto" if is_muted else "Attivo")
 
-        for player in self.video_players:
-            if player.is_loaded:
-                player.set_muted(is_muted)
+        for player in self._loaded_players:
+            player.set_muted(is_muted)
 
         self.master_mute_button.setText("🔇 MUTO" if is_muted else "🔊 AUDIO")
 
@@ -903,19 +1002,24 @@ class MainWindow(QMainWindow):
         """
         fps_text = self.fps_combo.currentText()
         
-        if fps_text == "Auto":
-            return None
-        elif fps_text == "Personalizzato":
+        if fps_text == "Personalizzato":
             return self.custom_fps
-        else:
-            # Estrae il numero dalla stringa (es. "24 fps" -> 24.0)
-            try:
-                return float(fps_text.replace(" fps", ""))
-            except ValueError:
-                return None
+        return self._FPS_VALUES.get(fps_text)
     
+    def _reset_fps_combo_to_auto(self):
+        """Riporta il combo FPS su "Auto" senza che on_fps_changed reagisca."""
+        self._target_fps = None
+        self._in_fps_update = True
+        try:
+            self.fps_combo.setCurrentText("Auto")
+        finally:
+            self._in_fps_update = False
+
     def on_fps_changed(self, fps_text):
         """Gestisce il cambio di selezione FPS e applica il playback rate appropriato."""
+        # Cambio programmatico (vedi _reset_fps_combo_to_auto): niente da applicare
+        if self._in_fps_update:
+            return
         logger.log_user_action("Selezione FPS cambiata", fps_text)
 
         # Se si seleziona "Personalizzato", apri il dialog
@@ -926,16 +1030,16 @@ class MainWindow(QMainWindow):
                 logger.log_user_action("FPS Personalizzato selezionato", f"{custom_fps:.3f} fps")
             else:
                 # L'utente ha annullato, reimposta il combo box a "Auto"
-                self.fps_combo.blockSignals(True)
-                self.fps_combo.setCurrentText("Auto")
-                self.fps_combo.blockSignals(False)
+                self._reset_fps_combo_to_auto()
                 return
 
         # Applica il playback rate a tutti i video caricati
         target_fps = self.get_selected_fps()
+        # Memorizzato per i video caricati in seguito (on_video_load_state_changed)
+        self._target_fps = target_fps
         
-        for player in self.video_players:
-            if player.is_loaded and player.detected_fps > 0:
+        for player in self._loaded_players:
+            if player.detected_fps > 0:
                 if target_fps is None:
                     # Auto: playback rate = 1.0 (velocità normale)
                     player.set_playback_rate(1.0)
@@ -959,23 +1063,33 @@ class MainWindow(QMainWindow):
         Applica il playback rate basato sul FPS selezionato se il video è appena stato caricato.
         """
         player = self.video_players[video_index]
-        self._update_ui_for_state()
+        # Ricostruzione O(4), solo al cambio di stato: i loop caldi iterano solo i player caricati
+        # e i controlli per indice leggono _loaded_flags senza toccare i widget
+        self._loaded_players = [p for p in self.video_players if p.is_loaded]
+        self._loaded_flags[video_index] = player.is_loaded
+        self._load_state_debouncer.call(self._refresh_after_load_state_change)
+
+        # Auto-load: quando l'ultimo video atteso è pronto, reimposta subito lo status
+        pending = self._autoload_pending
+        if is_loaded and pending is not None and video_index in pending:
+            pending.discard(video_index)
+            if not pending:
+                self._reset_status_after_autoload()
 
         # Se il video è appena stato caricato, applica il playback rate basato sul FPS selezionato
         if is_loaded and player.detected_fps > 0:
-            target_fps = self.get_selected_fps()
-            if target_fps is None:
-                # Auto: mantieni velocità normale
-                player.set_playback_rate(1.0)
-            else:
-                # Applica il rate calcolato
-                rate = player.detected_fps / target_fps
+            target_fps = self._target_fps
+            # Auto: velocità normale; altrimenti rate = nativo / target
+            rate = 1.0 if target_fps is None else player.detected_fps / target_fps
+            # Nessun setter (e nessun segnale) se il player ha già quel rate
+            if abs(player.media_player.playbackRate() - rate) > 1e-6:
                 player.set_playback_rate(rate)
-                logger.log_video_action(
-                    video_index,
-                    "Playback rate applicato al caricamento",
-                    f"{rate:.3f}x (nativo: {player.detected_fps:.2f}fps -> target: {target_fps:.2f}fps)"
-                )
+                if target_fps is not None:
+                    logger.log_video_action(
+                        video_index,
+                        "Playback rate applicato al caricamento",
+                        f"{rate:.3f}x (nativo: {player.detected_fps:.2f}fps -> target: {target_fps:.2f}fps)"
+                    )
         
         logger.log_video_action(
             video_index,
@@ -983,6 +1097,17 @@ class MainWindow(QMainWindow):
             f"is_loaded={is_loaded}, sync_enabled={self.sync_enabled}"
         )
 
+    def _refresh_after_load_state_change(self):
+        """Aggiorna visibilità controlli e timeline globale una sola volta per raffica di caricamenti."""
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_ui_for_state()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Il player di riferimento della timeline globale può essere cambiato
+        self.update_timeline_position()
+
     def resync_all(self):
         """Risincronizza tutti i video alla posizione del video master."""
         logger.log_user_action("Risincronizzazione manuale")
@@ -990,7 +1115,7 @@ class MainWindow(QMainWindow):
         master_index = self.sync_manager.get_master_video_index()
         master_player = self.video_players[master_index]
 
-        if master_player.is_loaded:
+        if self._loaded_flags[master_index]:
             master_position = master_player.get_position()
             self.sync_manager.sync_all_to_master(master_position, self.video_players)
 
@@ -1000,21 +1125,18 @@ class MainWindow(QMainWindow):
                                   f"Tutti i video risincronizzati al Video {master_index + 1}!")
         else:
             # Cerca il primo video caricato come fallback
-            fallback_success = False
-            for i, player in enumerate(self.video_players):
-                if player.is_loaded:
-                    reference_position = player.get_position()
-                    self.sync_manager.set_master_video(i)
-                    self.sync_manager.sync_all_to_master(reference_position, self.video_players)
-                    fallback_success = True
-
-                    self._force_timeline_updates(reference_position, i)
+            fallback_player = self._first_loaded_player()
+            if fallback_player is not None:
+                i = fallback_player.video_index
+                reference_position = fallback_player.get_position()
+                self.sync_manager.set_master_video(i)
+                self.sync_manager.sync_all_to_master(reference_position, self.video_players)
 
-                    QMessageBox.information(self, "Risincronizzazione",
-                                          f"Video master impostato a Video {i + 1}. Tutti sincronizzati!")
-                    break # Esci dal loop dopo aver trovato il fallback
+                self._force_timeline_updates(reference_position, i)
 
-            if not fallback_success:
+                QMessageBox.information(self, "Risincronizzazione",
+                                      f"Video master impostato a Video {i + 1}. Tutti sincronizzati!")
+            else:
                  QMessageBox.warning(self, "Errore", "Nessun video caricato da usare come riferimento!")
     
     def fit_all_videos(self):
@@ -1022,76 +1144,94 @@ class MainWindow(QMainWindow):
         
         Calcola le dimensioni che il video avrebbe al 100% di zoom (senza zoom)
         e adatta il container a quelle dimensioni mantenendo l'aspect ratio.
+        Il reset dello zoom e il ridimensionamento dei controlli vengono
+        eseguiti in un unico passaggio differito (_finalize_fit), senza
+        processEvents() annidati.
         """
-        logger.log_user_action("Fit video manuale", "Adattamento container alle dimensioni native")
+        # Coalesce pressioni ripetute di Ctrl+R mentre un fit è in corso
+        if self._fit_in_progress:
+            return
         
-        # Forza processamento eventi pending per stabilizzare layout
-        QApplication.processEvents()
+        logger.log_user_action("Fit video manuale", "Adattamento container alle dimensioni native")
         
-        fitted_count = 0
-        for player in self.video_players:
-            if player.is_loaded and player.video_width > 0 and player.video_height > 0:
-                # Log dimensioni PRIMA dell'adattamento
-                widget_width_before = player.video_widget.width()
-                widget_height_before = player.video_widget.height()
-                viewport_width_before = player.video_widget.viewport().rect().width()
-                viewport_height_before = player.video_widget.viewport().rect().height()
-                container_height_before = player.video_container.height()
-                
-                # Calcola la larghezza disponibile per il video (rispettando i margini)
-                available_width = player.video_widget.width()
-                
-                # Calcola l'altezza ideale mantenendo l'aspect ratio del video nativo
-                video_aspect_ratio = player.video_width / player.video_height if player.video_height > 0 else 1.0
-                ideal_container_height = int(available_width / video_aspect_ratio)
-                
-                if not self.sync_enabled:
-                    # L'altezza dinamica (.height()) può essere 0 se il layout non è finalizzato.
-                    # Usiamo i valori fissi definiti nella UI.
-                    CONTROLS_FIXED_HEIGHT = 38  # Altezza dei pulsanti di controllo individuali
-                    TIMELINE_FIXED_HEIGHT = 80  # Altezza della timeline individuale
-                    
-                    total_controls_height = CONTROLS_FIXED_HEIGHT + TIMELINE_FIXED_HEIGHT
-                    
-                    # Sottrai l'altezza dei controlli dall'altezza ideale
-                    ideal_container_height -= total_controls_height
-                    
-                    logger.log_video_action(player.video_index, "Fit video (SYNC OFF)", f"Altezza controlli (fissa): {total_controls_height}px, Altezza video corretta: {ideal_container_height}px")
-                
-                # Imposta SOLO il minimum height, lascia che il maximum si adatti ai controlli
-                player.video_container.setMinimumHeight(ideal_container_height)
-                player.video_container.setMaximumHeight(ideal_container_height)
+        debug_enabled = logger.is_debug_enabled()
+        fitted = []
+        # Nessun repaint intermedio mentre si cambiano i vincoli dei container:
+        # i setMinimum/MaximumHeight accodano già la richiesta di layout
+        self.setUpdatesEnabled(False)
+        try:
+            for player in self._loaded_players:
+                if player.aspect_ratio > 0:
+                    # Dimensioni PRIMA dell'adattamento, lette solo se finiranno nel log
+                    before = None
+                    if debug_enabled:
+                        viewport_rect = player.video_widget.viewport().rect()
+                        before = (
+                            player.video_widget.width(),
+                            player.video_widget.height(),
+                            viewport_rect.width(),
+                            viewport_rect.height(),
+                            player.video_container.height(),
+                        )
                 
-                # Rimuovi vincoli dal widget interno per permettere adattamento
-                player.video_widget.setMinimumHeight(0)
-                player.video_widget.setMaximumHeight(16777215)
+                    # Calcola la larghezza disponibile per il video (rispettando i margini)
+                    available_width = player.video_widget.width()
                 
-                # Invalida il layout per forzare il ricalcolo
-                player.layout().invalidate()
-                player.layout().activate()
+                    # Altezza ideale con l'aspect ratio nativo (calcolato al caricamento),
+                    # meno i controlli individuali se visibili (SYNC OFF)
+                    video_aspect_ratio = player.aspect_ratio
+                    ideal_container_height = int(available_width / video_aspect_ratio)
+                    if not self.sync_enabled:
+                        ideal_container_height -= _CONTROLS_PLUS_TIMELINE
+                        if debug_enabled:
+                            logger.log_video_action(player.video_index, "Fit video (SYNC OFF)", f"Altezza controlli (fissa): {_CONTROLS_PLUS_TIMELINE}px, Altezza video corretta: {ideal_container_height}px", level=logging.DEBUG)
                 
-                # Aggiorna geometry
-                player.video_widget.updateGeometry()
-                player.video_container.updateGeometry()
-                player.updateGeometry()
+                    # Imposta SOLO il minimum height, lascia che il maximum si adatti ai controlli
+                    player.video_container.setMinimumHeight(ideal_container_height)
+                    player.video_container.setMaximumHeight(ideal_container_height)
                 
-                # Process events per permettere al layout di ricalcolare
-                QApplication.processEvents()
+                    # Rimuovi vincoli dal widget interno per permettere adattamento
+                    player.video_widget.setMinimumHeight(0)
+                    player.video_widget.setMaximumHeight(16777215)
                 
+                    fitted.append((player, before, ideal_container_height, video_aspect_ratio))
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        if not fitted:
+            logger.log_user_action("Fit video", "Nessun video caricato da adattare")
+            return
+        
+        # Un solo passaggio di layout per tutti i player
+        self.layout().activate()
+        
+        self._fit_in_progress = True
+        self._pending_fit = fitted
+        QTimer.singleShot(0, self._finalize_fit)
+
+    def _finalize_fit(self):
+        """Completa il fit: reset zoom, ridimensiona i controlli e logga le dimensioni finali."""
+        fitted, self._pending_fit = self._pending_fit, []
+        try:
+            for player, before, ideal_container_height, video_aspect_ratio in fitted:
                 # Reset zoom per mostrare il video al 100% (senza zoom)
                 player.video_widget.reset_zoom_pan()
                 
                 # Se i controlli sono visibili (SYNC OFF), ridimensionali
                 if player.controls_widget.isVisible():
-                    QTimer.singleShot(100, player.resize_controls_to_video)
+                    player.resize_controls_to_video()
+                
+                if before is None:
+                    continue
                 
-                fitted_count += 1
+                widget_width_before, widget_height_before, viewport_width_before, viewport_height_before, container_height_before = before
                 
                 # Log dimensioni dopo l'adattamento
                 widget_width_after = player.video_widget.width()
                 widget_height_after = player.video_widget.height()
-                viewport_width_after = player.video_widget.viewport().rect().width()
-                viewport_height_after = player.video_widget.viewport().rect().height()
+                viewport_rect_after = player.video_widget.viewport().rect()
+                viewport_width_after = viewport_rect_after.width()
+                viewport_height_after = viewport_rect_after.height()
                 container_height_after = player.video_container.height()
                 
                 # Calcola percentuale di copertura del container (quanto il viewport copre il container)
@@ -1106,16 +1246,16 @@ class MainWindow(QMainWindow):
                     f"Container: h{container_height_before}→h{container_height_after}, "
                     f"Widget: {widget_width_before}x{widget_height_before}→{widget_width_after}x{widget_height_after}, "
                     f"Viewport: {viewport_width_before}x{viewport_height_before}→{viewport_width_after}x{viewport_height_after}, "
-                    f"Copertura: {coverage_before:.1f}%→{coverage_after:.1f}%"
+                    f"Copertura: {coverage_before:.1f}%→{coverage_after:.1f}%",
+                    level=logging.DEBUG
                 )
+        finally:
+            self._fit_in_progress = False
         
-        if fitted_count > 0:
-            logger.log_user_action(
-                "Fit video completato",
-                f"{fitted_count} video adattati"
-            )
-        else:
-            logger.log_user_action("Fit video", "Nessun video caricato da adattare")
+        logger.log_user_action(
+            "Fit video completato",
+            f"{len(fitted)} video adattati"
+        )
 
     def _force_timeline_updates(self, master_position: int, master_index: int):
         """Forza l'aggiornamento della timeline globale e di quelle individuali
@@ -1126,20 +1266,8 @@ class MainWindow(QMainWindow):
         self.timeline_widget.set_position(master_position)
         self.timeline_widget.update() # Forza ridisegno
 
-        # 2. Aggiorna le timeline individuali
-        for i, player in enumerate(self.video_players):
-            if player.is_loaded:
-                # 3. Calcola la posizione sincronizzata target per questo player
-                sync_position = self.sync_manager.calculate_sync_position(
-                    source_position=master_position,
-                    source_index=master_index,
-                    target_index=i
-                )
-                # 4. Imposta la posizione calcolata sulla timeline individuale
-                player.timeline_widget.set_position(sync_position)
-                player.timeline_widget.update() # Forza ridisegno
-                # 5. Aggiorna l'etichetta del tempo con la posizione calcolata
-                player.update_time_label(sync_position, player.get_duration())
+        # 2. Ogni player caricato riallinea la propria timeline nel suo slot
+        self.force_resync.emit(master_position, master_index)
 
     def on_video_seeked(self, video_index, position):
         """
@@ -1161,33 +1289,39 @@ class MainWindow(QMainWindow):
         # if self.sync_enabled:
         #     logger.log_user_action(f"Sincronizzazione timeline", f"Video {video_index + 1} -> posizione {position}ms")
 
+    def _on_frame_step_changed(self, index: int):
+        """Memorizza lo step in ms corrispondente alla voce selezionata."""
+        if 0 <= index < len(self._FRAME_STEP_OPTIONS):
+            self._frame_step_ms = self._FRAME_STEP_OPTIONS[index][1]
+
     def step_frames(self, frame_count):
         """Muove tutti i video di un numero specifico di frame.
 
+        Gli step ravvicinati (auto-repeat dei tasti freccia) vengono sommati
+        e applicati con un solo seek per player entro 16ms.
+
         Args:
             frame_count: Numero di frame da avanzare (positivo) o retrocedere (negativo)
         """
-        # Determina lo step in millisecondi dal ComboBox
-        step_text = self.frame_step_combo.currentText()
-        if "40ms" in step_text:
-            step_ms = 40
-        elif "33ms" in step_text:
-            step_ms = 33
-        elif "100ms" in step_text:
-            step_ms = 100
-        elif "200ms" in step_text:
-            step_ms = 200
-        else:
-            step_ms = 40
+        self._pending_step += frame_count
+        if not self._step_flush_timer.isActive():
+            self._step_flush_timer.start()
+
+    def _flush_step(self):
+        """Applica in un colpo solo gli step frame accumulati da step_frames."""
+        frame_count, self._pending_step = self._pending_step, 0
+        if frame_count == 0:
+            return
 
-        # Calcola lo spostamento totale
-        total_step = step_ms * frame_count
+        # Calcola lo spostamento totale (step già risolto al cambio del selettore)
+        total_step = self._frame_step_ms * frame_count
 
-        # Applica a tutti i video caricati
-        for i, player in enumerate(self.video_players):
-            if player.is_loaded:
-                current_pos = player.get_position()
-                new_pos = max(0, min(player.get_duration(), current_pos + total_step))
+        # Applica a tutti i video caricati (chiamate dirette: uno slot Python via segnale costerebbe di più)
+        for player in self._loaded_players:
+            current_pos = player.get_position()
+            new_pos = max(0, min(player.get_duration(), current_pos + total_step))
+            # Ai bordi (inizio/fine) lo step non sposta nulla: evita un seek inutile
+            if new_pos != current_pos:
                 player.seek_position(new_pos, emit_signal=False)
 
         # Log azione
@@ -1205,6 +1339,7 @@ class MainWindow(QMainWindow):
         self.sync_manager.set_sync_enabled(self.sync_enabled)
         logger.log_user_action("Sincronizzazione", "ON" if self.sync_enabled else "OFF")
         self._update_ui_for_state()
+        self.update_timeline_position()
 
     def toggle_frame_mode(self, state):
         """Attiva/disattiva la modalità frame e aggiorna l'UI."""
@@ -1213,17 +1348,11 @@ class MainWindow(QMainWindow):
 
         if self.frame_mode_enabled:
             # Pausa tutti i video quando si entra in modalità frame
-            for player in self.video_players:
-                if player.is_loaded:
-                    player.pause()
+            for player in self._loaded_players:
+                player.pause()
             
             # Aggiorna stato pulsante compatto
             self.play_pause_button_compact.setText("▶")
-            self.play_pause_button_compact.setObjectName("compactPlayButton")
-            style = self.play_pause_button_compact.style()
-            if style:
-                style.unpolish(self.play_pause_button_compact)  # type: ignore[attr-defined]
-                style.polish(self.play_pause_button_compact)  # type: ignore[attr-defined]
 
         self._update_ui_for_state()
 
@@ -1259,11 +1388,15 @@ class MainWindow(QMainWindow):
         # Il gruppo Riproduzione è visibile solo se sync è ON
         self.playback_group.setVisible(sync_on)
         # Visibilità generale
-        self.frame_controls_widget.setVisible(frame_mode_on)
+        if frame_mode_on:
+            self._ensure_frame_controls().show()
+        elif self.frame_controls_widget is not None:
+            self.frame_controls_widget.hide()
         self.fps_selector_widget.setVisible(not frame_mode_on)
 
-        # Forza un aggiornamento del layout per applicare le modifiche
-        QApplication.processEvents()
+        # Applica subito la geometria senza rientrare nell'event loop
+        # (processEvents() poteva eseguire tasti in coda a metà aggiornamento)
+        self.layout().activate()
 
     def show_help(self):
         """Mostra il dialogo della guida."""
@@ -1327,7 +1460,7 @@ class MainWindow(QMainWindow):
 
         if not self.sync_enabled:
             # Controlla se il video cliccato è effettivamente caricato
-            if self.video_players[video_index].is_loaded:
+            if self._loaded_flags[video_index]:
                 # Imposta questo video come master nel sync manager
                 self.sync_manager.set_master_video(video_index)
                 # (Il log di set_master_video è già gestito da SyncManager)
@@ -1356,12 +1489,24 @@ class MainWindow(QMainWindow):
                              f"Video {video_index + 1} @ {position}ms")
 
         # Aggiorna timeline globale e timeline di ogni video player
-        self.timeline_widget.update()
-        for player in self.video_players:
-            player.update_markers()
+        self._schedule_marker_refresh()
 
     # ==================== MARKER MANAGEMENT ====================
 
+    def _schedule_marker_refresh(self):
+        """Accoda un solo refresh delle timeline per tutte le modifiche ai marker del ciclo corrente."""
+        if self._marker_refresh_pending:
+            return
+        self._marker_refresh_pending = True
+        QTimer.singleShot(0, self._do_marker_refresh)
+
+    def _do_marker_refresh(self):
+        """Ricostruisce i marker della timeline globale e di ogni video player."""
+        self._marker_refresh_pending = False
+        self.timeline_widget.refresh_markers()  # Rebuild index + repaint
+        for player in self.video_players:
+            player.update_markers()
+
     def add_marker_at_current_position(self):
         """Aggiunge un marker alla posizione corrente del video.
 
@@ -1373,17 +1518,11 @@ class MainWindow(QMainWindow):
 
         if self.sync_enabled:
             # Modalità SYNC: aggiungi UN SOLO marker globale
-            # Trova il primo video caricato per ottenere la posizione
-            position = 0
-            has_video = False
-            for player in self.video_players:
-                # 'source()' può restituire una QUrl() vuota che valuta a True
-                if player.is_loaded:
-                    position = player.media_player.position()
-                    has_video = True
-                    break  # Trovato il primo video caricato
+            # Il primo video caricato (riferimento) fornisce la posizione
+            reference_player = self._first_loaded_player()
 
-            if has_video:
+            if reference_player is not None:
+                position = reference_player.media_player.position()
                 # Aggiungi un SOLO marker con video_index=None (globale)
                 marker = self.marker_manager.add_marker(
                     timestamp=position,
@@ -1415,23 +1554,15 @@ class MainWindow(QMainWindow):
                                   f"Clicca su un video caricato prima di aggiungere un marker.")
 
         # Aggiorna timeline globale e timeline di ogni video player
-        self.timeline_widget.refresh_markers()  # Rebuild index + repaint
-        for player in self.video_players:
-            player.update_markers()
+        self._schedule_marker_refresh()
 
     def go_to_previous_marker(self):
         """Naviga al marker precedente."""
-        current_position = 0
-        player_found = False
-        for player in self.video_players:
-            if player.is_loaded: # Controllo 'is_loaded'
-                current_position = player.media_player.position()
-                player_found = True
-                break
-
-        if not player_found:
+        reference_player = self._first_loaded_player()
+        if reference_player is None:
              logger.log_user_action("Nessun video caricato per determinare la posizione")
              return
+        current_position = reference_player.media_player.position()
 
         search_position = max(0, current_position - 1) # Cerca da 1ms prima
         marker = self.marker_manager.get_previous_marker(search_position)
@@ -1447,20 +1578,13 @@ class MainWindow(QMainWindow):
 
     def go_to_next_marker(self):
         """Naviga al marker successivo."""
-        current_position = 0
-        player_found = False
-        duration = 0 # Durata massima tra i video caricati
-
-        for player in self.video_players:
-            if player.is_loaded: # Controllo 'is_loaded'
-                if not player_found:
-                    current_position = player.media_player.position()
-                    player_found = True
-                duration = max(duration, player.get_duration()) # Trova durata massima
-
-        if not player_found:
+        reference_player = self._first_loaded_player()
+        if reference_player is None:
              logger.log_user_action("Nessun video caricato per determinare la posizione")
              return
+        current_position = reference_player.media_player.position()
+        # Durata massima tra i video caricati
+        duration = max(player.get_duration() for player in self._loaded_players)
 
         search_position = current_position + 1 # Cerca da 1ms dopo
         marker = self.marker_manager.get_next_marker(search_position)
@@ -1478,33 +1602,32 @@ class MainWindow(QMainWindow):
     def seek_to_timestamp(self, timestamp_ms: int):
         """Naviga a un timestamp specifico su tutti i video, calcolando gli offset."""
         
-        # 1. Trova il player di riferimento (il primo caricato, come in update_timeline_position)
-        reference_player = None
-        reference_index = -1
-        for idx, player in enumerate(self.video_players):
-            if player.is_loaded:
-                reference_player = player
-                reference_index = idx
-                break
+        # 1. Player di riferimento: il primo caricato, come in update_timeline_position
+        reference_player = self._first_loaded_player()
         
         # 2. Se non c'è video, non fare nulla
-        if reference_index == -1:
+        if reference_player is None:
             logger.log_user_action("Seek timeline fallito", "Nessun video di riferimento caricato")
             return
+        reference_index = reference_player.video_index
 
         logger.log_user_action(f"Seek timeline (SYNC Globale)", f"{timestamp_ms}ms (Rif: Video {reference_index + 1})")
 
-        # 3. Itera e imposta la posizione calcolata per TUTTI i video
-        for i, player in enumerate(self.video_players):
-            if player.is_loaded:
-                # 4. Calcola la posizione corretta usando il SyncManager
-                # Il timestamp cliccato è relativo al player di riferimento
+        # 3. Itera e imposta la posizione calcolata per TUTTI i video caricati
+        for player in self._loaded_players:
+            # 4. Calcola la posizione corretta usando il SyncManager
+            # Il timestamp cliccato è relativo al player di riferimento (per lui l'offset si annulla)
+            if player is reference_player:
+                sync_position = max(0, timestamp_ms)
+            else:
                 sync_position = self.sync_manager.calculate_sync_position(
                     source_position=timestamp_ms,
                     source_index=reference_index,
-                    target_index=i
+                    target_index=player.video_index
                 )
-                # 5. Imposta la posizione (senza emettere segnale per evitare loop)
+            # 5. Imposta la posizione (senza emettere segnale per evitare loop),
+            #    saltando il seek se il player è già esattamente lì
+            if player.get_position() != sync_position:
                 player.seek_position(sync_position, emit_signal=False)
 
     def on_marker_clicked(self, marker):
@@ -1540,12 +1663,7 @@ class MainWindow(QMainWindow):
         is_global_timeline = (sender_widget == self.timeline_widget)
         
         # Determina da quale video proviene il segnale (se timeline individuale)
-        sender_video_index = None
-        if not is_global_timeline:
-            for i, player in enumerate(self.video_players):
-                if player.timeline_widget == sender_widget:
-                    sender_video_index = i
-                    break
+        sender_video_index = None if is_global_timeline else self._timeline_to_index.get(sender_widget)
         
         if self.sync_enabled:
             # ============ SYNC ON ============
@@ -1555,9 +1673,7 @@ class MainWindow(QMainWindow):
                 if success:
                     logger.log_user_action("Marker rimosso (SYNC ON, Globale)", 
                                          f"ID: {marker.id} @ {time_str} - Rimosso da tutti i video")
-                    self.timeline_widget.refresh_markers()
-                    for player in self.video_players:
-                        player.update_markers()
+                    self._schedule_marker_refresh()
                 else:
                     logger.log_error("Errore rimozione marker", f"ID: {marker.id} non trovato")
                     
@@ -1565,27 +1681,18 @@ class MainWindow(QMainWindow):
                 # Rimozione da timeline individuale di un marker globale:
                 # Trasforma il marker globale in marker specifici per gli ALTRI video
                 
-                # Rimuovi il marker globale
-                self.marker_manager.remove_marker(marker.id)
-                
-                # Crea marker specifici per tutti i video TRANNE quello da cui è stato rimosso
-                for i in range(4):
-                    if i != sender_video_index and self.video_players[i].is_loaded:
-                        self.marker_manager.add_marker(
-                            timestamp=marker.timestamp,
-                            color=marker.color,
-                            description=marker.description,
-                            category=marker.category,
-                            video_index=i  # Marker specifico per questo video
-                        )
+                # Sostituisci il marker globale con marker specifici per tutti i video
+                # caricati TRANNE quello da cui è stato rimosso (una sola mutazione)
+                self.marker_manager.replace_global_with_per_video(
+                    marker.id,
+                    [p.video_index for p in self._loaded_players if p.video_index != sender_video_index]
+                )
                 
                 logger.log_user_action(f"Marker rimosso (SYNC ON, Video {sender_video_index + 1})", 
                                      f"ID: {marker.id} @ {time_str} - Marker globale rimosso da Video {sender_video_index + 1}, mantenuto negli altri")
                 
                 # Aggiorna tutte le timeline
-                self.timeline_widget.refresh_markers()
-                for player in self.video_players:
-                    player.update_markers()
+                self._schedule_marker_refresh()
             else:
                 logger.log_user_action("Rimozione marker ignorata", 
                                      "SYNC ON, marker specifico non rimovibile da timeline individuale")
@@ -1598,32 +1705,21 @@ class MainWindow(QMainWindow):
                     if success:
                         logger.log_user_action(f"Marker rimosso (SYNC OFF, Video {sender_video_index + 1})", 
                                              f"ID: {marker.id} @ {time_str}")
-                        self.timeline_widget.refresh_markers()
-                        for player in self.video_players:
-                            player.update_markers()
+                        self._schedule_marker_refresh()
                     else:
                         logger.log_error("Errore rimozione marker", f"ID: {marker.id} non trovato")
                 elif marker.video_index is None:
                     # Marker globale: stessa logica di SYNC ON + timeline individuale
                     # Rimuovi il marker globale e crea marker specifici per gli altri video
-                    self.marker_manager.remove_marker(marker.id)
-                    
-                    for i in range(4):
-                        if i != sender_video_index and self.video_players[i].is_loaded:
-                            self.marker_manager.add_marker(
-                                timestamp=marker.timestamp,
-                                color=marker.color,
-                                description=marker.description,
-                                category=marker.category,
-                                video_index=i
-                            )
+                    self.marker_manager.replace_global_with_per_video(
+                        marker.id,
+                        [p.video_index for p in self._loaded_players if p.video_index != sender_video_index]
+                    )
                     
                     logger.log_user_action(f"Marker globale rimosso (SYNC OFF, Video {sender_video_index + 1})", 
                                          f"ID: {marker.id} @ {time_str} - Rimosso da Video {sender_video_index + 1}, mantenuto negli altri")
                     
-                    self.timeline_widget.refresh_markers()
-                    for player in self.video_players:
-                        player.update_markers()
+                    self._schedule_marker_refresh()
                 else:
                     logger.log_user_action("Rimozione marker ignorata", 
                                          f"Marker appartiene a un altro video (Video {marker.video_index + 1})")
@@ -1635,10 +1731,14 @@ class MainWindow(QMainWindow):
     
     # ==================== GESTIONE ESPORTAZIONE (NUOVA) ====================
 
+    def _first_loaded_player(self) -> Optional[VideoPlayerWidget]:
+        """Primo player caricato (ordine della griglia), in O(1) da _loaded_players."""
+        return self._loaded_players[0] if self._loaded_players else None
+
     def get_reference_player(self) -> Optional[VideoPlayerWidget]:
         """Trova il primo video player caricato da usare come riferimento."""
-        for player in self.video_players:
-            if player.is_loaded and player.video_path:
+        for player in self._loaded_players:
+            if player.video_path:
                 return player
         return None
 
@@ -1667,11 +1767,13 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # 2. Raccogli tutti i video caricati
-        video_paths = {}  # Dict[int, Path]
-        for i, player in enumerate(self.video_players):
-            if player.is_loaded and player.video_path:
-                video_paths[i] = player.video_path
+        # 2. Raccogli tutti i video caricati: snapshot unico di path e durata,
+        #    riusato da validazione ed export senza rileggere i player
+        loaded_info: Dict[int, Tuple[Path, int]] = {
+            player.video_index: (player.video_path, player.get_duration())
+            for player in self._loaded_players if player.video_path
+        }
+        video_paths = {i: path for i, (path, _) in loaded_info.items()}  # Dict[int, Path]
         
         if not video_paths:
             QMessageBox.warning(
@@ -1681,14 +1783,15 @@ class MainWindow(QMainWindow):
             )
             return
         
-        markers = list(self.marker_manager.markers) # Copia la lista
+        # Snapshot immutabile: l'export lo legge da un altro thread mentre la lista può cambiare
+        markers = tuple(self.marker_manager.markers)
         
         # 3. Ottieni i secondi N e M dai controlli timeline
         sec_before, sec_after = self.timeline_controls.get_export_times()
         
         # 3.5 VALIDAZIONE MARKER: Controlla se ci sono marker con tempo insufficiente
         problematic_markers = self._validate_markers_for_export(
-            markers, video_paths, sec_before, sec_after
+            markers, loaded_info, sec_before, sec_after
         )
         
         if problematic_markers:
@@ -1698,6 +1801,10 @@ class MainWindow(QMainWindow):
                 logger.log_export_action("Esportazione annullata - marker con tempo insufficiente")
                 return
         
+        # Moduli di export caricati solo qui, non all'avvio dell'applicazione
+        from ui.simple_export_dialog import SimpleExportDialog
+        from core.advanced_exporter import AdvancedVideoExporter, default_export_workers
+
         # 4. Apri dialog semplificato (solo destinazione e qualità)
         config = SimpleExportDialog.get_export_config_simple(self)
         
@@ -1705,10 +1812,8 @@ class MainWindow(QMainWindow):
             logger.log_export_action("Esportazione annullata dall'utente")
             return
         
-        # 5. Calcola numero automatico di worker (CPU count - 1, min 1)
-        import multiprocessing as mp
-        cpu_count = mp.cpu_count()
-        max_workers = max(1, cpu_count - 1)
+        # 5. Calcola numero automatico di worker (CPU count - 1, min 1, max EXPORT_MAX_WORKERS)
+        max_workers = default_export_workers()
         
         # 6. Configura thread e worker avanzato con impostazioni automatiche
         self.export_thread = QThread()
@@ -1753,16 +1858,16 @@ class MainWindow(QMainWindow):
     
     def _validate_markers_for_export(
         self, 
-        markers: List[Marker], 
-        video_paths: Dict[int, Path], 
+        markers: Sequence[Marker], 
+        loaded_info: Dict[int, Tuple[Path, int]], 
         sec_before: float, 
         sec_after: float
     ) -> List[Dict[str, Any]]:
         """Valida i marker per l'export e ritorna una lista di marker problematici.
         
         Args:
-            markers: Lista di marker da validare
-            video_paths: Dict di video paths {video_index: Path}
+            markers: Marker da validare (sequenza indicizzabile)
+            loaded_info: Snapshot dei video caricati {video_index: (Path, durata_ms)}
             sec_before: Secondi richiesti prima del marker
             sec_after: Secondi richiesti dopo il marker
             
@@ -1778,51 +1883,49 @@ class MainWindow(QMainWindow):
                 'available_after': float
             }
         """
+        import numpy as np  # Import locale: serve solo all'avvio dell'export
+
+        # Video verificabili (durata nota), nell'ordine dello snapshot
+        checked = [(video_idx, duration_ms) for video_idx, (_, duration_ms) in loaded_info.items()
+                   if duration_ms > 0]
+        if not markers or not checked:
+            return []
+
+        # Matrice marker x video: quali coppie vanno verificate.
+        # I marker globali (video_index is None) si verificano su tutti i video
+        column_of = {video_idx: col for col, (video_idx, _) in enumerate(checked)}
+        applies = np.zeros((len(markers), len(checked)), dtype=bool)
+        applies[[m.video_index is None for m in markers], :] = True
+        specific = [(row, column_of[m.video_index]) for row, m in enumerate(markers)
+                    if m.video_index is not None and m.video_index in column_of]
+        if specific:
+            rows, cols = zip(*specific)
+            applies[rows, cols] = True
+
+        # Tempo disponibile prima e dopo ogni marker, per ogni video (broadcast M x V)
+        positions_sec = np.array([m.timestamp for m in markers], dtype=np.float64) / 1000.0
+        durations_sec = np.array([duration for _, duration in checked], dtype=np.float64) / 1000.0
+        available_before = np.broadcast_to(positions_sec[:, None], applies.shape)
+        available_after = durations_sec[None, :] - positions_sec[:, None]
+
+        # Codice problema a 2 bit senza rami: (prima insufficiente << 1) | dopo insufficiente,
+        # 0 = nessun problema (o coppia da non verificare)
+        codes = ((available_before < sec_before).astype(np.uint8) << 1) | (available_after < sec_after)
+        codes *= applies
+
+        # Solo le coppie problematiche diventano dict (ordine: marker, poi video)
+        issue_names = self._ISSUE_BY_CODE
         problematic = []
-        
-        for marker in markers:
-            # Per marker globali (video_index is None), controlla tutti i video
-            videos_to_check = video_paths.keys() if marker.video_index is None else [marker.video_index]
-            
-            for video_idx in videos_to_check:
-                if video_idx not in video_paths:
-                    continue
-                
-                # Ottieni durata del video
-                player = self.video_players[video_idx]
-                if not player.is_loaded:
-                    continue
-                
-                duration_ms = player.get_duration()
-                if duration_ms <= 0:
-                    continue
-                
-                duration_sec = duration_ms / 1000.0
-                marker_pos_sec = marker.timestamp / 1000.0
-                
-                # Calcola tempo disponibile prima e dopo
-                available_before = marker_pos_sec
-                available_after = duration_sec - marker_pos_sec
-                
-                # Determina il problema
-                issue = None
-                if available_before < sec_before and available_after < sec_after:
-                    issue = 'both'
-                elif available_before < sec_before:
-                    issue = 'before'
-                elif available_after < sec_after:
-                    issue = 'after'
-                
-                if issue:
-                    problematic.append({
-                        'marker': marker,
-                        'video_index': video_idx,
-                        'issue': issue,
-                        'position_sec': marker_pos_sec,
-                        'duration_sec': duration_sec,
-                        'available_before': available_before,
-                        'available_after': available_after
-                    })
+        for row, col in zip(*np.nonzero(codes)):
+            problematic.append({
+                'marker': markers[row],
+                'video_index': checked[col][0],
+                'issue': issue_names[codes[row, col]],
+                'position_sec': float(positions_sec[row]),
+                'duration_sec': float(durations_sec[col]),
+                'available_before': float(available_before[row, col]),
+                'available_after': float(available_after[row, col])
+            })
         
         return problematic
     
@@ -1842,16 +1945,30 @@ class MainWindow(QMainWindow):
         Returns:
             True se l'utente vuole procedere comunque, False se annulla
         """
-        from PyQt6.QtWidgets import QMessageBox, QTextEdit
-        
-        # Costruisci messaggio dettagliato
-        msg = QMessageBox(self)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        msg.setWindowTitle("⚠ Marker con Tempo Insufficiente")
-        msg.setStandardButtons(
-            QMessageBox.StandardButton.Yes | 
-            QMessageBox.StandardButton.No
-        )
+        # Il dialog (icona, pulsanti, stile) viene costruito una sola volta e riutilizzato
+        msg = self._warning_msgbox
+        if msg is None:
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Icon.Warning)
+            msg.setWindowTitle("⚠ Marker con Tempo Insufficiente")
+            msg.setStandardButtons(
+                QMessageBox.StandardButton.Yes | 
+                QMessageBox.StandardButton.No
+            )
+            msg.setInformativeText("Dettagli marker problematici:")
+            
+            # Personalizza pulsanti
+            yes_btn = msg.button(QMessageBox.StandardButton.Yes)
+            no_btn = msg.button(QMessageBox.StandardButton.No)
+            
+            if yes_btn:
+                yes_btn.setText("Procedi Comunque")
+            if no_btn:
+                no_btn.setText("Annulla Export")
+            
+            # Stile globale solo se non già ereditato dall'applicazione
+            apply_main_stylesheet(msg)
+            self._warning_msgbox = msg
         
         # Testo principale
         count = len(problematic_markers)
@@ -1861,48 +1978,31 @@ class MainWindow(QMainWindow):
             "I clip esportati saranno più corti del previsto."
         )
         
-        # Dettagli dei marker problematici
-        details = []
-        for item in problematic_markers:
+        # Dettagli dei marker problematici (requisiti formattati una sola volta, fuori dal loop)
+        problem_templates = self._PROBLEM_TEMPLATES
+        entry_template = self._PROBLEM_ENTRY_TEMPLATE
+        format_time_for_display = self._format_time_for_display
+        req_before = f"{sec_before:.1f}"
+        req_after = f"{sec_after:.1f}"
+
+        def describe(item: Dict[str, Any]) -> str:
             marker = item['marker']
-            video_idx = item['video_index']
-            issue = item['issue']
-            pos_sec = item['position_sec']
-            available_before = item['available_before']
-            available_after = item['available_after']
-            
-            # Formatta posizione
-            pos_str = self._format_time_for_display(pos_sec)
-            
-            # Descrizione problema
-            if issue == 'both':
-                problem = f"Tempo insufficiente PRIMA ({available_before:.2f}s disponibili) e DOPO ({available_after:.2f}s disponibili)"
-            elif issue == 'before':
-                problem = f"Tempo insufficiente PRIMA del marker (disponibili: {available_before:.2f}s, richiesti: {sec_before:.1f}s)"
-            else:  # after
-                problem = f"Tempo insufficiente DOPO del marker (disponibili: {available_after:.2f}s, richiesti: {sec_after:.1f}s)"
-            
+            pos_str = format_time_for_display(item['position_sec'])
+            problem = problem_templates[item['issue']].format(
+                before=item['available_before'],
+                after=item['available_after'],
+                req_before=req_before,
+                req_after=req_after
+            )
             # Descrizione marker o posizione
-            marker_label = marker.description if marker.description else f"Marker @ {pos_str}"
-            feed_name = "Tutti i feed" if marker.video_index is None else f"Feed-{video_idx + 1}"
-            
-            details.append(f"• {marker_label} ({feed_name})\n  Posizione: {pos_str}\n  {problem}\n")
-        
-        details_text = "\n".join(details)
-        msg.setInformativeText("Dettagli marker problematici:")
-        msg.setDetailedText(details_text)
-        
-        # Personalizza pulsanti
-        yes_btn = msg.button(QMessageBox.StandardButton.Yes)
-        no_btn = msg.button(QMessageBox.StandardButton.No)
-        
-        if yes_btn:
-            yes_btn.setText("Procedi Comunque")
-        if no_btn:
-            no_btn.setText("Annulla Export")
-        
-        # Applica stile globale per coerenza
-        msg.setStyleSheet(get_main_stylesheet())
+            return entry_template.format(
+                label=marker.description or f"Marker @ {pos_str}",
+                feed="Tutti i feed" if marker.video_index is None else f"Feed-{item['video_index'] + 1}",
+                pos=pos_str,
+                problem=problem
+            )
+
+        msg.setDetailedText("\n".join(describe(item) for item in problematic_markers))
         
         logger.log_export_action(
             "Marker validation warning",
@@ -1922,42 +2022,43 @@ class MainWindow(QMainWindow):
         Returns:
             Stringa formattata come HH:MM:SS.mmm
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        return format_time(round(seconds * 1000))
     
     def _enter_export_modal_state(self):
         """Disabilita controlli durante export."""
-        # Disabilita timeline controls che contiene export button e altri controlli
-        widgets_to_disable: list[QWidget] = [self.timeline_controls]
-        
-        # Aggiungi anche i frame step buttons
-        widgets_to_disable.append(self.back_10_frames_btn)
-        widgets_to_disable.append(self.back_1_frame_btn)
-        widgets_to_disable.append(self.forward_1_frame_btn)
-        widgets_to_disable.append(self.forward_10_frames_btn)
-        
-        # Aggiungi anche load button dai video player
-        for player in self.video_players:
-            widgets_to_disable.append(player.load_button)
-            widgets_to_disable.append(player.remove_button)
-        
+        # Timeline controls (export/marker), pulsanti frame step e load/remove dei player
         self.modal_manager.enter_modal_state(
-            widgets_to_disable,
+            self._export_disable_widgets,
             "Export in corso"
         )
+        self._update_playback_shortcuts()
         logger.log_user_action("Modal state", "Export iniziato - controlli disabilitati")
         
         # Notifica l'utente
-        self.status_indicator.setText(f"● ESPORTAZIONE…")
-        self.status_indicator.setProperty("status", "exporting")
+        self._set_status_indicator("● ESPORTAZIONE…", "exporting")
+
+    def _should_log_export_progress(self, force: bool = False) -> bool:
+        """Limita i log di progresso export a uno ogni 0.5s (sempre se force)."""
+        now = time.monotonic()
+        if force or now - self._last_progress_log_time >= 0.5:
+            self._last_progress_log_time = now
+            return True
+        return False
+
+    def _update_export_status(self, text: str, force: bool = False):
+        """Aggiorna lo status indicator durante l'export al massimo 4 volte al secondo (sempre se force)."""
+        now = time.monotonic()
+        if not force and now - self._last_status_update_time < 0.25:
+            return
+        self._last_status_update_time = now
+        # La property cambia solo all'ingresso in export: nessun re-polish ad ogni progresso
+        self._set_status_indicator(text, "exporting")
 
     def on_export_progress(self, message: str):
         """Aggiorna lo status indicator con il progresso."""
-        logger.log_export_action("Progresso", message)
-        self.status_indicator.setText(f"● {message.upper()}")
-        self.status_indicator.setProperty("status", "exporting")
+        if self._should_log_export_progress():
+            logger.log_export_action("Progresso", message)
+        self._update_export_status(f"● {message.upper()}")
 
     def on_export_finished(self, message: str):
         """Chiamato al termine dell'esportazione."""
@@ -1965,17 +2066,12 @@ class MainWindow(QMainWindow):
         
         # Esci da modal state - riabilita controlli
         self.modal_manager.exit_modal_state()
+        self._update_playback_shortcuts()
         logger.log_user_action("Modal state", "Export completato - controlli riabilitati")
         
-        self.status_indicator.setText("● SISTEMA PRONTO")
-        self.status_indicator.setProperty("status", "ok")
-        self.update_dependency_status()  # Aggiorna tooltip
+        self._set_status_indicator("● SISTEMA PRONTO", "ok")
         
-        QMessageBox.information(
-            self,
-            "Esportazione Completata",
-            message
-        )
+        self._show_export_result(QMessageBox.Icon.Information, "Esportazione Completata", message)
         self.cleanup_export_thread()
 
     def on_export_error(self, error_message: str):
@@ -1984,19 +2080,31 @@ class MainWindow(QMainWindow):
         
         # Esci da modal state anche in caso di errore
         self.modal_manager.exit_modal_state()
+        self._update_playback_shortcuts()
         logger.log_user_action("Modal state", "Export fallito - controlli riabilitati")
         
-        self.status_indicator.setText("● ERRORE EXPORT")
-        self.status_indicator.setProperty("status", "error")
-        self.update_dependency_status()  # Aggiorna tooltip
+        self._set_status_indicator("● ERRORE EXPORT", "error")
         
-        QMessageBox.critical(
-            self,
+        self._show_export_result(
+            QMessageBox.Icon.Critical,
             "Errore Esportazione",
             f"Si è verificato un errore:\n\n{error_message}"
         )
         self.cleanup_export_thread()
 
+    def _show_export_result(self, icon: QMessageBox.Icon, title: str, text: str) -> None:
+        """Mostra l'esito dell'export riutilizzando un unico QMessageBox."""
+        msg = self._export_result_msgbox
+        if msg is None:
+            msg = QMessageBox(self)
+            msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+            self._export_result_msgbox = msg
+        msg.setIcon(icon)
+        msg.setWindowTitle(title)
+        msg.setText(text)
+        msg.setDetailedText("")  # Nessun residuo da usi precedenti
+        msg.exec()
+
     def cleanup_export_thread(self):
         """Pulisce i riferimenti al thread e al worker."""
         self.exporter = None
@@ -2004,9 +2112,9 @@ class MainWindow(QMainWindow):
     
     def on_export_progress_advanced(self, message: str, current: int, total: int):
         """Callback per progresso export avanzato."""
-        logger.log_export_action("Progresso", f"{message} ({current}/{total})")
-        self.status_indicator.setText(f"● {message}")
-        self.status_indicator.setProperty("status", "exporting")
+        if self._should_log_export_progress(force=current == total):
+            logger.log_export_action("Progresso", f"{message} ({current}/{total})")
+        self._update_export_status(f"● {message}", force=current == total)
         
     def on_export_job_completed(self, job_id: str):
         """Callback quando un job di export completa."""
@@ -2016,45 +2124,61 @@ class MainWindow(QMainWindow):
         """Callback quando un job di export fallisce."""
         logger.log_export_action(f"Job fallito: {job_id}", error_message)
         # Ripristina status dopo 5 secondi
-        QTimer.singleShot(5000, self.reset_status_indicator)
+        QTimer.singleShot(5000, Qt.TimerType.CoarseTimer, self.reset_status_indicator)
+
+    def _set_status_indicator(self, text: Optional[str], status: str):
+        """Aggiorna testo e stato (property per lo stylesheet) dello status indicator.
+
+        La property viene riassegnata, con re-polish, solo quando lo stato cambia davvero.
+        """
+        indicator = self.status_indicator
+        if text is not None:
+            indicator.setText(text)
+        if indicator.property("status") != status:
+            indicator.setProperty("status", status)
+            # I selettori [status="..."] del QSS vengono rivalutati solo con un re-polish
+            style = indicator.style()
+            if style is not None:
+                style.unpolish(indicator)
+                style.polish(indicator)
 
     def reset_status_indicator(self):
         """Resetta lo status indicator allo stato base."""
         # Controlla che non sia in corso un'altra esportazione
         if not (self.export_thread and self.export_thread.isRunning()): # type: ignore
-            self.status_indicator.setText("● SISTEMA PRONTO")
-            self.status_indicator.setProperty("status", "ok")
+            self._set_status_indicator("● SISTEMA PRONTO", "ok")
+
+    def on_player_timing_changed(self, video_index: int):
+        """Inoltra alla timeline globale solo gli aggiornamenti del player di riferimento."""
+        reference_player = self._first_loaded_player()
+        if reference_player is not None and reference_player.video_index == video_index:
+            self._timeline_throttler.call(self.update_timeline_position)
 
     def update_timeline_position(self):
         """Aggiorna la posizione corrente sulla timeline basandosi sul primo video rilevato."""
-        # Chiamato dal timer di aggiornamento ogni 100ms
+        # Chiamato dai segnali position_changed/duration_changed del player di riferimento
 
-        # Cerca il PRIMO video caricato disponibile nel loop (non sempre il primo slot)
-        active_player = None
-        active_player_index = -1
+        timeline = self.timeline_widget
 
-        for idx, player in enumerate(self.video_players):
-            # Controlla se il player ha un video caricato
-            if player.is_loaded: # Controllo 'is_loaded'
-                active_player = player
-                active_player_index = idx
-                break  # Si ferma al primo video trovato
+        # Il PRIMO video caricato (non sempre il primo slot), già noto da _loaded_players
+        active_player = self._first_loaded_player()
 
         # Se c'è un video attivo, aggiorna la timeline con i suoi dati
         if active_player:
+            active_player_index = active_player.video_index
             position = active_player.media_player.position()
             duration = active_player.media_player.duration()
 
             # Aggiorna posizione sulla timeline globale
             # Verifica se la timeline globale è visibile (SYNC ON) prima di aggiornare
             if self.sync_enabled:
-                 self.timeline_widget.set_position(position)
+                 timeline.set_position(position)
             # Altrimenti (SYNC OFF), le timeline individuali vengono già aggiornate
             # dal segnale positionChanged del player
 
             # Imposta durata globale solo se è cambiata
-            if duration > 0 and self.timeline_widget.duration_ms != duration:
-                self.timeline_widget.set_duration(duration)
+            if duration > 0 and timeline.duration_ms != duration:
+                timeline.set_duration(duration)
                 # Log solo quando cambia la durata (evita spam nel log)
                 logger.log_user_action(
                     "Durata Timeline Globale aggiornata",
@@ -2062,11 +2186,32 @@ class MainWindow(QMainWindow):
                 )
 
     def autosave_markers(self):
-        """Salva automaticamente i markers se modificati."""
-        if self.marker_manager.is_modified:
-            success = self.marker_manager.save()
-            if success:
-                logger.log_user_action("Auto-save markers", f"{self.marker_manager.count} markers salvati")
+        """Salva automaticamente i markers se modificati (IO sul pool globale, non sul thread GUI)."""
+        marker_manager = self.marker_manager
+        # Un solo salvataggio alla volta: il prossimo tick riprova (il flag di modifica resta)
+        if not marker_manager.is_modified or self._autosave_in_flight:
+            return
+        save_job = marker_manager.prepare_save()
+        if save_job is None:
+            return
+        count = marker_manager.count
+
+        def run_autosave():
+            # Solo IO sul pool: flag ed esito vengono applicati sul thread GUI
+            self._autosave_finished.emit(save_job, save_job(), count)
+
+        self._autosave_in_flight = True
+        QThreadPool.globalInstance().start(run_autosave)
+
+    def _on_autosave_finished(self, save_job, success: bool, count: int):
+        """Applica sul thread GUI l'esito di un auto-save eseguito sul pool."""
+        self._autosave_in_flight = False
+        if success:
+            logger.log_user_action("Auto-save markers", f"{count} markers salvati")
+        else:
+            # I marker non salvati tornano modificati: il prossimo tick riprova
+            save_job.mark_unsaved()
+            logger.log_error("Auto-save markers fallito", "Nuovo tentativo al prossimo auto-save")
 
     def keyPressEvent(self, event):  # type: ignore[override]
         """Gestisce eventi tastiera, incluso F11 per fullscreen."""
@@ -2083,9 +2228,8 @@ class MainWindow(QMainWindow):
             )
             
             # Aggiorna i controlli dei video player in base al nuovo stato
-            for player in self.video_players:
-                # Passa lo stato futuro (l'opposto di quello attuale)
-                player.update_controls_for_fullscreen(not is_fullscreen_now)
+            # (lo stato futuro, l'opposto di quello attuale)
+            self._apply_fullscreen_controls(not is_fullscreen_now)
             
             if self.isFullScreen():
                 self.showNormal()
@@ -2095,26 +2239,62 @@ class MainWindow(QMainWindow):
         else:
             super().keyPressEvent(event)
     
+    def _deferred_startup(self):
+        """Inizializzazione differita: visibilità controlli (sync ON) e auto-load dei video."""
+        self.toggle_sync(Qt.CheckState.Checked.value)
+        if self.auto_load_enabled:
+            self.auto_load_videos()
+
     def _initialize_window_mode(self):
         """Inizializza i controlli dei video player in modalità windowed all'avvio."""
-        for player in self.video_players:
-            player.update_controls_for_fullscreen(False)  # False = windowed mode
+        self._apply_fullscreen_controls(False, force=True)  # False = windowed mode
+
+    def _apply_fullscreen_controls(self, is_fullscreen: bool, force: bool = False) -> bool:
+        """Applica lo stato fullscreen ai controlli dei player solo se è cambiato.
+
+        Returns:
+            True se i controlli sono stati aggiornati
+        """
+        if not force and is_fullscreen == self._last_is_fullscreen:
+            return False
+        self._last_is_fullscreen = is_fullscreen
+        # Testi e dimensioni di tutti i pulsanti cambiano insieme: un solo repaint alla fine
+        self.setUpdatesEnabled(False)
+        try:
+            for player in self.video_players:
+                player.update_controls_for_fullscreen(is_fullscreen)
+        finally:
+            self.setUpdatesEnabled(True)
+        return True
+
+    def showEvent(self, event):  # type: ignore[override]
+        """Calcola lo stato delle dipendenze alla prima visualizzazione."""
+        super().showEvent(event)
+        self.update_dependency_status()
 
     def changeEvent(self, event):  # type: ignore[override]
         """Gestisce i cambiamenti di stato della finestra (es. fullscreen/maximized)."""
         super().changeEvent(event)
         
+        # Ritorno sulla finestra (es. dopo aver installato una dipendenza dal terminale):
+        # ricontrolla le dipendenze se il risultato memoizzato è scaduto
+        if (event.type() == QEvent.Type.ActivationChange and self.isActiveWindow()
+                and not self._dependency_probe_pending and is_dependency_cache_stale()):
+            self._dependency_status_dirty = True
+            self.update_dependency_status()
+            return
+        
         # Rileva cambio di stato fullscreen/windowed/maximized
         if event.type() == QEvent.Type.WindowStateChange:
             # Considera "fullscreen" sia WindowFullScreen che WindowMaximized
             is_fullscreen = bool(
-                (self.windowState() & Qt.WindowState.WindowFullScreen) or
-                (self.windowState() & Qt.WindowState.WindowMaximized)
+                self.windowState() & (Qt.WindowState.WindowFullScreen | Qt.WindowState.WindowMaximized)
             )
             
-            # Aggiorna i controlli di tutti i video player
-            for player in self.video_players:
-                player.update_controls_for_fullscreen(is_fullscreen)
+            # Aggiorna i controlli di tutti i video player (niente se il bit non è cambiato,
+            # es. minimizza/ripristina o gli eventi ripetuti di alcuni window manager)
+            if not self._apply_fullscreen_controls(is_fullscreen):
+                return
             
             logger.log_user_action(
                 "Window state changed",
@@ -2124,6 +2304,9 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):  # type: ignore[override]
         """Gestisce la chiusura dell'applicazione con cleanup deterministico."""
         logger.log_user_action("Chiusura applicazione")
+        self._timeline_throttler.cancel()
+        self._load_state_debouncer.cancel()
+        self._step_flush_timer.stop()
         
         if self.cache_manager:
             stats = self.cache_manager.get_global_stats()
@@ -2135,32 +2318,56 @@ class MainWindow(QMainWindow):
             )
             self.cache_manager.clear_all()
         
+        # Le attese bloccanti in background (probe video, auto-save, preferenze export) si sovrappongono
+        # e vengono unite in un solo join limitato a fine chiusura
+        background_pools = [QThreadPool.globalInstance()]
         if self.async_loader:
             logger.log_user_action("Pulizia async loader", "Chiusura thread in corso")
-            self.async_loader.cleanup_all()
+            self.async_loader.cleanup_all(wait=False)
+            background_pools.append(self.async_loader.pool)
         
         if self.export_thread and self.export_thread.isRunning():
             logger.log_export_action("Interruzione esportazione per chiusura app")
+            thread = self.export_thread
             if self.exporter:
+                # Scollega i callback UI: nessun dialog di errore/fine durante la chiusura
+                for signal in (self.exporter.finished, self.exporter.error, self.exporter.progress,
+                               self.exporter.job_completed, self.exporter.job_failed):
+                    try:
+                        signal.disconnect()
+                    except TypeError:
+                        pass  # Già disconnesso
                 self.exporter.stop()
-            self.export_thread.quit()
-            self.export_thread.wait(2000) # Attendi max 2 sec
-
-        # Salva markers prima di chiudere
-        if self.marker_manager.is_modified:
-            self.marker_manager.save()
-            logger.log_user_action("Markers salvati", f"{self.marker_manager.count} markers")
-
-        for player in self.video_players:
+            thread.requestInterruption()
+            thread.quit()
+            # Attendi max 2 sec a piccoli passi, lasciando ridisegnare la finestra
+            deadline = QDeadlineTimer(2000)
+            while thread.isRunning() and not deadline.hasExpired():
+                QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents, 50)
+                thread.wait(50)
+
+        # Salvataggio finale sincrono: se un auto-save è ancora in corso, il lock del manager
+        # attende che finisca (senza timeout) e lo snapshot completo copre anche un suo eventuale
+        # fallimento, il cui esito non verrebbe più consegnato al thread GUI
+        marker_manager = self.marker_manager
+        if marker_manager.is_modified or self._autosave_in_flight:
+            if marker_manager.save():
+                logger.log_user_action("Markers salvati", f"{marker_manager.count} markers")
+            elif marker_manager.project_path:
+                logger.log_error("Salvataggio markers fallito", "Chiusura applicazione")
+
+        players = self.video_players
+        for player in players:
             if player.is_loaded:
                 player.stop()
                 # Usa cleanup_video(remove_path=False) per mantenere i percorsi salvati
                 player.cleanup_video(remove_path=False)
         logger.log_user_action("Cleanup video completato", "Percorsi salvati mantenuti per prossimo avvio")
-        
-        # Garbage collection finale
-        collected = gc.collect()
-        logger.log_user_action("GC finale", f"{collected} oggetti raccolti")
+
+        # Join unico: max 2 secondi complessivi per tutti i pool, non 2 secondi per ciascuno
+        deadline = QDeadlineTimer(2000)
+        for pool in background_pools:
+            pool.waitForDone(max(0, deadline.remainingTime()))
 
         event.accept()
         logger.log_user_action("Applicazione chiusa")
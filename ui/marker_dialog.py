@@ -9,12 +9,19 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableWidget,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 from pathlib import Path
+from functools import lru_cache
 
 from core.markers import MarkerManager, Marker
-from ui.styles import get_main_stylesheet
+from ui.styles import apply_main_stylesheet
 from core.utils import format_time
 
 
+@lru_cache(maxsize=64)
+def _qcolor(hex_color: str) -> QColor:
+    """QColor per un colore hex, parsato una sola volta per processo (palette piccola)."""
+    return QColor(hex_color)
+
+
 class MarkerManagerDialog(QDialog):
     """Dialog per visualizzare e gestire tutti i markers."""
     
@@ -23,6 +30,7 @@ class MarkerManagerDialog(QDialog):
         
         self.marker_manager = marker_manager
         self.filtered_markers = list(marker_manager.markers)
+        self._last_stats_text = ""
         
         self.setWindowTitle("Gestione Markers - SyncView")
         self.setMinimumSize(900, 600)
@@ -30,7 +38,7 @@ class MarkerManagerDialog(QDialog):
         self.setup_ui()
         self.load_markers()
         
-        self.setStyleSheet(get_main_stylesheet())
+        apply_main_stylesheet(self)
     
     def setup_ui(self):
         """Configura l'interfaccia utente."""
@@ -136,34 +144,37 @@ class MarkerManagerDialog(QDialog):
     
     def load_markers(self):
         """Carica i markers nella tabella."""
-        self.table.setRowCount(0)
-        
-        for marker in self.filtered_markers:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # Timestamp
-            self.table.setItem(row, 0, QTableWidgetItem(str(marker.timestamp)))
-            
-            # Tempo formattato
-            time_str = format_time(marker.timestamp)
-            self.table.setItem(row, 1, QTableWidgetItem(time_str))
-            
-            # Categoria
-            self.table.setItem(row, 2, QTableWidgetItem(marker.category))
-            
-            # Colore (con visual)
-            color_item = QTableWidgetItem(marker.color)
-            color_item.setBackground(QColor(marker.color))
-            self.table.setItem(row, 3, color_item)
-            
-            # Descrizione
-            self.table.setItem(row, 4, QTableWidgetItem(marker.description or ""))
-            
-            # Salva marker nell'item per recupero
-            item = self.table.item(row, 0)
-            if item:
-                item.setData(Qt.ItemDataRole.UserRole, marker)
+        table = self.table
+        # Un solo passaggio di layout/paint per tutte le righe invece di uno per insertRow,
+        # senza dispatch di itemChanged & co. per ogni setItem
+        table.setUpdatesEnabled(False)
+        signals_were_blocked = table.blockSignals(True)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(self.filtered_markers))
+
+            for row, marker in enumerate(self.filtered_markers):
+                # Timestamp (con il marker salvato nell'item per recupero)
+                timestamp_item = QTableWidgetItem(str(marker.timestamp))
+                timestamp_item.setData(Qt.ItemDataRole.UserRole, marker)
+                table.setItem(row, 0, timestamp_item)
+
+                # Tempo formattato
+                table.setItem(row, 1, QTableWidgetItem(format_time(marker.timestamp)))
+
+                # Categoria
+                table.setItem(row, 2, QTableWidgetItem(marker.category))
+
+                # Colore (con visual)
+                color_item = QTableWidgetItem(marker.color)
+                color_item.setBackground(_qcolor(marker.color))
+                table.setItem(row, 3, color_item)
+
+                # Descrizione
+                table.setItem(row, 4, QTableWidgetItem(marker.description or ""))
+        finally:
+            table.blockSignals(signals_were_blocked)
+            table.setUpdatesEnabled(True)
         
         # Aggiorna statistiche
         self.update_statistics()
@@ -172,38 +183,44 @@ class MarkerManagerDialog(QDialog):
         """Aggiorna le statistiche visualizzate."""
         stats = self.marker_manager.get_statistics()
         
-        text = f"<b>Totale markers:</b> {stats['total']} | "
+        text = f"<b>Totale markers:</b> {stats['total']}"
         
         if stats['by_category']:
-            text += "<b>Per categoria:</b> "
-            for cat, count in stats['by_category'].items():
-                text += f"{cat}: {count}, "
-            text = text.rstrip(", ")
+            text += " | <b>Per categoria:</b> " + ", ".join(
+                f"{cat}: {count}" for cat, count in stats['by_category'].items()
+            )
         
-        self.stats_label.setText(text)
+        # Evita di ri-renderizzare il rich text della label se le statistiche non cambiano
+        if text != self._last_stats_text:
+            self._last_stats_text = text
+            self.stats_label.setText(text)
     
     def apply_filters(self):
         """Applica i filtri selezionati."""
         category = self.category_filter.currentData()
+        markers = self.marker_manager.markers
         
-        self.filtered_markers = []
-        
-        for marker in self.marker_manager.markers:
-            # Filtro categoria
-            if category and marker.category != category:
-                continue
-            
-            self.filtered_markers.append(marker)
+        # Copia (non alias): delete_selected_marker fa pop() su filtered_markers
+        if not category:
+            self.filtered_markers = list(markers)
+        else:
+            self.filtered_markers = [m for m in markers if m.category == category]
         
         self.load_markers()
     
-    def get_selected_marker(self) -> Marker | None:
-        """Ottiene il marker selezionato."""
+    def _selected_row(self) -> int | None:
+        """Indice della riga selezionata (coincide con l'indice in filtered_markers)."""
         selected = self.table.selectedItems()
         if not selected:
             return None
+        return selected[0].row()
+    
+    def get_selected_marker(self) -> Marker | None:
+        """Ottiene il marker selezionato."""
+        row = self._selected_row()
+        if row is None:
+            return None
         
-        row = selected[0].row()
         item = self.table.item(row, 0)
         if item:
             return item.data(Qt.ItemDataRole.UserRole)
@@ -224,8 +241,9 @@ class MarkerManagerDialog(QDialog):
     
     def edit_selected_marker(self):
         """Modifica il marker selezionato."""
+        row = self._selected_row()
         marker = self.get_selected_marker()
-        if not marker:
+        if row is None or not marker:
             QMessageBox.warning(self, "Attenzione", "Nessun marker selezionato.")
             return
         
@@ -243,12 +261,16 @@ class MarkerManagerDialog(QDialog):
                 marker.id,
                 description=new_desc
             )
-            self.load_markers()
+            # Cambia solo la descrizione: aggiorna la sola cella invece di ricostruire la tabella
+            desc_item = self.table.item(row, 4)
+            if desc_item:
+                desc_item.setText(new_desc)
     
     def delete_selected_marker(self):
         """Elimina il marker selezionato."""
+        row = self._selected_row()
         marker = self.get_selected_marker()
-        if not marker:
+        if row is None or not marker:
             QMessageBox.warning(self, "Attenzione", "Nessun marker selezionato.")
             return
         
@@ -262,7 +284,10 @@ class MarkerManagerDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes and marker.id:
             self.marker_manager.remove_marker(marker.id)
-            self.apply_filters()
+            # Rimuove solo la riga eliminata (il filtro di categoria non cambia)
+            self.table.removeRow(row)
+            self.filtered_markers.pop(row)
+            self.update_statistics()
     
     def clear_all_markers(self):
         """Cancella tutti i markers."""
@@ -279,7 +304,9 @@ class MarkerManagerDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.marker_manager.clear_all()
-            self.load_markers()
+            self.filtered_markers = []
+            self.table.setRowCount(0)
+            self.update_statistics()
             QMessageBox.information(self, "Completato", "Tutti i markers sono stati eliminati.")
     
     def export_csv(self):
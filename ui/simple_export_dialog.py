@@ -4,24 +4,29 @@ Simplified Export Dialog - Solo destinazione e qualità.
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QDialogButtonBox, QWidget, 
-                             QLineEdit, QFileDialog, QComboBox, QGroupBox)
-from PyQt6.QtCore import Qt
+                             QLineEdit, QComboBox, QGroupBox)
+from PyQt6.QtCore import Qt, QThreadPool
 from pathlib import Path
 from typing import Optional
 import json
+import os
 
 from core.advanced_exporter import ExportQuality
 from config.settings import EXPORT_SETTINGS_FILE
 from config.user_paths import user_path_manager
-from ui.styles import get_main_stylesheet
+from ui.styles import apply_main_stylesheet
 
 
 class ExportSettings:
     """Gestisce il caricamento e salvataggio delle impostazioni di export."""
     
-    @staticmethod
-    def load() -> dict:
-        """Carica le impostazioni salvate."""
+    # Qualità letta da EXPORT_SETTINGS_FILE, valida finché il file non cambia (mtime)
+    _cached_quality: Optional[str] = None
+    _cached_mtime_ns: Optional[int] = None
+    
+    @classmethod
+    def load(cls) -> dict:
+        """Carica le impostazioni salvate (il file viene riletto solo se modificato)."""
         # Usa user_path_manager per la directory
         last_dir = user_path_manager.get_export_dir()
         if not last_dir:
@@ -32,39 +37,75 @@ class ExportSettings:
             'last_quality': ExportQuality.MEDIUM.name
         }
         
+        # Un solo stat (niente exists() + open): file assente -> default
         try:
-            if EXPORT_SETTINGS_FILE.exists():
-                with open(EXPORT_SETTINGS_FILE, 'r') as f:
-                    saved = json.load(f)
-                    # Merge solo per quality (directory viene da user_path_manager)
-                    if 'last_quality' in saved:
-                        default_settings['last_quality'] = saved['last_quality']
-        except Exception:
-            pass  # Usa default se caricamento fallisce
+            mtime_ns = os.stat(EXPORT_SETTINGS_FILE).st_mtime_ns
+        except OSError:
+            return default_settings  # Nessun file salvato
+        
+        if mtime_ns != cls._cached_mtime_ns:
+            try:
+                # Lettura binaria: json.loads decodifica direttamente i bytes UTF-8
+                with open(EXPORT_SETTINGS_FILE, 'rb') as f:
+                    saved = json.loads(f.read())
+                # Merge solo per quality (directory viene da user_path_manager)
+                cls._cached_quality = saved.get('last_quality')
+                cls._cached_mtime_ns = mtime_ns
+            except Exception:
+                return default_settings  # Usa default se caricamento fallisce
+        
+        if cls._cached_quality is not None:
+            default_settings['last_quality'] = cls._cached_quality
         
         return default_settings
     
-    @staticmethod
-    def save(directory: Path, quality: ExportQuality) -> None:
-        """Salva le impostazioni."""
+    @classmethod
+    def save(cls, directory: Path, quality: ExportQuality) -> None:
+        """Salva le impostazioni (scrive solo ciò che è cambiato)."""
         try:
-            # Salva directory in user_path_manager
-            user_path_manager.set_export_dir(directory)
+            # Salva directory in user_path_manager (file diverso: niente scrittura se invariata)
+            if user_path_manager.get_export_dir() != directory:
+                user_path_manager.set_export_dir(directory)
             
             # Salva solo quality in EXPORT_SETTINGS_FILE
-            EXPORT_SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            settings = {
-                'last_quality': quality.name
-            }
-            with open(EXPORT_SETTINGS_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
+            if quality.name == cls._cached_quality and EXPORT_SETTINGS_FILE.exists():
+                return
         except Exception:
-            pass  # Ignora errori di salvataggio
+            return  # Ignora errori di salvataggio
+        
+        cls._cached_quality = quality.name
+        payload = json.dumps({'last_quality': quality.name}, separators=(',', ':'))
+        
+        def write_quality():
+            try:
+                EXPORT_SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+                # Un solo write compatto su file temporaneo + rename atomico
+                tmp_path = EXPORT_SETTINGS_FILE.with_name(EXPORT_SETTINGS_FILE.name + '.tmp')
+                tmp_path.write_text(payload)
+                os.replace(tmp_path, EXPORT_SETTINGS_FILE)
+                # Il prossimo load() non deve rileggere il file appena scritto
+                cls._cached_mtime_ns = os.stat(EXPORT_SETTINGS_FILE).st_mtime_ns
+            except Exception:
+                pass  # Ignora errori di salvataggio
+        
+        # IO sul pool globale: il dialog si chiude senza attendere il disco
+        # (closeEvent della finestra principale attende il pool prima di uscire)
+        QThreadPool.globalInstance().start(write_quality)
 
 
 class SimpleExportDialog(QDialog):
     """Dialog semplificato per export - Solo destinazione e qualità."""
     
+    # Voci del combo qualità, nell'ordine di visualizzazione
+    _QUALITY_OPTIONS = (
+        ("⚡ Fast Preview - Anteprime veloci", ExportQuality.FAST_PREVIEW),
+        ("⚖ Medium - Bilanciato [Consigliato]", ExportQuality.MEDIUM),
+        ("⭐ High - Alta qualità", ExportQuality.HIGH),
+        ("💎 Best - Massima qualità (lento)", ExportQuality.BEST),
+    )
+    # Nome qualità -> indice nel combo
+    _QUALITY_INDEX = {quality.name: i for i, (_, quality) in enumerate(_QUALITY_OPTIONS)}
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("Configurazione Export")
@@ -82,7 +123,7 @@ class SimpleExportDialog(QDialog):
         layout.setSpacing(15)
         
         # Stile
-        self.setStyleSheet(get_main_stylesheet())
+        apply_main_stylesheet(self)
         
         # Titolo
         title = QLabel("⚙️ Configurazione Export")
@@ -123,21 +164,13 @@ class SimpleExportDialog(QDialog):
         quality_layout = QVBoxLayout(quality_group)
         
         self.quality_combo = QComboBox()
-        self.quality_combo.addItem("⚡ Fast Preview - Anteprime veloci", 
-                                  ExportQuality.FAST_PREVIEW.name)
-        self.quality_combo.addItem("⚖ Medium - Bilanciato [Consigliato]", 
-                                  ExportQuality.MEDIUM.name)
-        self.quality_combo.addItem("⭐ High - Alta qualità", 
-                                  ExportQuality.HIGH.name)
-        self.quality_combo.addItem("💎 Best - Massima qualità (lento)", 
-                                  ExportQuality.BEST.name)
-        
-        # Imposta qualità salvata
-        saved_quality = self.settings['last_quality']
-        for i in range(self.quality_combo.count()):
-            if self.quality_combo.itemData(i) == saved_quality:
-                self.quality_combo.setCurrentIndex(i)
-                break
+        for label, quality in self._QUALITY_OPTIONS:
+            self.quality_combo.addItem(label, quality.name)
+        
+        # Imposta qualità salvata (lookup diretto, senza scorrere itemData del combo)
+        self.quality_combo.setCurrentIndex(
+            self._QUALITY_INDEX.get(self.settings['last_quality'], 0)
+        )
         
         quality_layout.addWidget(self.quality_combo)
         
@@ -180,6 +213,9 @@ class SimpleExportDialog(QDialog):
     
     def browse_directory(self):
         """Apre il dialog per selezionare la directory."""
+        # Import al primo uso: serve solo quando l'utente clicca "Sfoglia"
+        from PyQt6.QtWidgets import QFileDialog
+        
         directory = QFileDialog.getExistingDirectory(
             self,
             "Seleziona Directory di Esportazione",
@@ -2,10 +2,15 @@
 Stili CSS per l'interfaccia tattica/militare di SyncView.
 """
 
+from functools import lru_cache
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
 from config.settings import THEME_COLORS
 
+@lru_cache(maxsize=1)
 def get_main_stylesheet():
-    """Ritorna il foglio di stile principale dell'applicazione."""
+    """Ritorna il foglio di stile principale dell'applicazione (calcolato una sola volta)."""
     return f"""
     /* ================================================================== */
     /* ==                  SYNCVIEW THEME - NIGHT OPS                  == */
@@ -73,8 +78,8 @@ def get_main_stylesheet():
     }}
 
     /* --- Pulsanti con Accento --- */
-    QPushButton#playButton, QPushButton#pauseButton,  /* Riferimento: Pulsante Play/Pausa Globale */
-    QPushButton#compactPlayButton, QPushButton#compactPauseButton,
+    QPushButton#playButton,  /* Riferimento: Pulsante Play/Pausa Globale */
+    QPushButton#compactPlayButton,
     QPushButton#loadVideoButton, QPushButton#refreshVideoButton, /* Riferimento: Pulsante Carica/Aggiorna Video Feed X */
     QPushButton#okButton {{ /* Riferimento: Pulsante Avvia Export (Dialog) */
         background-color: {THEME_COLORS['accent_positive']};
@@ -82,8 +87,8 @@ def get_main_stylesheet():
         font-weight: bold;
         color: #ffffff;
     }}
-    QPushButton#playButton:hover, QPushButton#pauseButton:hover, /* Riferimento: Pulsante Play/Pausa Globale */
-    QPushButton#compactPlayButton:hover, QPushButton#compactPauseButton:hover,
+    QPushButton#playButton:hover, /* Riferimento: Pulsante Play/Pausa Globale */
+    QPushButton#compactPlayButton:hover,
     QPushButton#loadVideoButton:hover, QPushButton#refreshVideoButton:hover, /* Riferimento: Pulsante Carica/Aggiorna Video Feed X */
     QPushButton#okButton:hover {{ /* Riferimento: Pulsante Avvia Export (Dialog) */
         background-color: {THEME_COLORS['accent_positive_hover']};
@@ -340,4 +345,16 @@ def get_main_stylesheet():
         border: 2px dashed {THEME_COLORS['accent_negative']};
         border-radius: 4px;
     }}
-    """
\ No newline at end of file
+    """
+
+
+def apply_main_stylesheet(widget: QWidget) -> None:
+    """Applica il tema a un dialog solo se non è già attivo a livello applicazione.
+
+    Il foglio di stile applicato a QApplication si propaga a tutti i widget:
+    ri-applicarlo al dialog costringerebbe Qt a riparsare il QSS ad ogni apertura.
+    """
+    app = QApplication.instance()
+    stylesheet = get_main_stylesheet()
+    if not isinstance(app, QApplication) or app.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
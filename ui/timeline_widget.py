@@ -6,7 +6,7 @@ Versione 3.0 - Ottimizzazioni: spatial indexing, viewport culling, debouncing
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QToolTip, QGroupBox
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRect, QRectF, QPointF, QTimer
 from PyQt6.QtGui import (QPainter, QColor, QPen, QBrush, QFont, QMouseEvent,
-                         QPaintEvent, QPolygonF, QFontMetrics, QCursor)
+                         QPaintEvent, QPolygonF, QFontMetrics, QCursor, QPixmap)
 
 from core.markers import Marker, MarkerManager
 from core.spatial_index import MarkerSpatialIndex, ViewportCalculator
@@ -49,6 +49,11 @@ class TimelineWidget(QWidget):
         # Cache per evitare ricalcoli
         self._cached_visible_markers: List[Marker] = []
         self._cache_valid = False
+        
+        # Layer statico (etichette, tacche, markers) renderizzato una volta su pixmap:
+        # durante il playback si ridisegnano solo progresso e playhead
+        self._static_layer: Optional[QPixmap] = None
+        self._static_layer_key: Optional[tuple] = None
         # ----------------------
 
         # Configurazione visuale
@@ -104,8 +109,9 @@ class TimelineWidget(QWidget):
         self._schedule_update('normal')
     
     def _invalidate_cache(self) -> None:
-        """Invalida la cache dei markers visibili."""
+        """Invalida la cache dei markers visibili (e il layer statico che li contiene)."""
         self._cache_valid = False
+        self._static_layer = None
     
     def _get_visible_markers(self) -> List[Marker]:
         """Ottiene i markers visibili nell'area corrente (con caching).
@@ -170,18 +176,38 @@ class TimelineWidget(QWidget):
         progress_rect = QRect(self.left_margin, self.ruler_y_pos, progress_width, self.ruler_height)
         painter.fillRect(progress_rect, QColor("#5F6F52")) # Verde Ranger
 
-        # 3. Disegna le etichette timestamp inizio/fine ai lati
-        self._draw_edge_labels(painter, width)
+        # 3-5. Etichette laterali, tacche e markers (layer statico in cache)
+        painter.drawPixmap(0, 0, self._get_static_layer(width, height, ruler_rect))
 
-        # 4. Disegna tacche e timestamp
-        self._draw_ticks_and_labels(painter, width, ruler_rect)
+        # 6. Disegna il Playhead (Indicatore di posizione)
+        self._draw_playhead(painter, current_x, height)
+
+    def _get_static_layer(self, width: int, height: int, ruler_rect: QRect) -> QPixmap:
+        """Ritorna la pixmap trasparente con gli elementi che non dipendono dalla posizione.
+        
+        Viene ridisegnata solo se invalidata (durata, resize, markers) o se
+        cambiano dimensioni, device pixel ratio o marker in hover.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (width, height, dpr, self.hover_marker)
+        if self._static_layer is not None and self._static_layer_key == key:
+            return self._static_layer
+
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-        # 5. Disegna markers e i loro timestamp sotto
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_edge_labels(painter, width)
+        self._draw_ticks_and_labels(painter, width, ruler_rect)
         if self.marker_manager:
             self._draw_markers_and_timestamps(painter, width)
+        painter.end()
 
-        # 6. Disegna il Playhead (Indicatore di posizione)
-        self._draw_playhead(painter, current_x, height)
+        self._static_layer = pixmap
+        self._static_layer_key = key
+        return pixmap
 
     def _draw_edge_labels(self, painter: QPainter, width: int):
         """Disegna le etichette timestamp all'inizio e alla fine della timeline."""
@@ -493,7 +519,6 @@ class TimelineWidget(QWidget):
         # Mostra tooltip semplice con il timestamp
         tooltip_text = f"<span style='color:#C19A6B; font-size:10pt;'>{time_str}</span>"
         
-        from PyQt6.QtGui import QCursor
         QToolTip.showText(QCursor.pos(), tooltip_text, self)
 
     def _check_hover(self) -> None:
@@ -599,7 +624,6 @@ class TimelineWidget(QWidget):
                         tooltip_text += f"<br>📂 {marker.category.title()}"
                 
                 # Usa QCursor.pos() invece di event.globalPosition() che non abbiamo più
-                from PyQt6.QtGui import QCursor
                 QToolTip.showText(QCursor.pos(), tooltip_text, self)
             else:
                 QToolTip.hideText()
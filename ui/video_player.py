@@ -16,6 +16,7 @@ from core.logger import logger
 from ui.timeline_widget import TimelineWidget
 # --- FINE FIX ---
 from core.markers import MarkerManager # type: ignore
+from core.sync_manager import SyncManager
 from core.video_loader import AsyncVideoLoader
 from core.frame_cache import FrameCache
 from core.utils import format_time
@@ -56,10 +57,14 @@ class VideoPlayerWidget(QWidget):
         self.detected_fps = 0.0  # FPS rilevato dal video
         self.video_width = 0  # Larghezza nativa del video
         self.video_height = 0  # Altezza nativa del video
+        self.aspect_ratio = 0.0  # width/height nativo, calcolato una volta al caricamento (0 = sconosciuto)
         self.marker_manager: MarkerManager | None = None  # Sarà impostato dal main window
         
         # Async loader (condiviso)
         self.async_loader: AsyncVideoLoader | None = None
+
+        # Sync manager (condiviso), per riallineare la timeline su force_resync
+        self.sync_manager: SyncManager | None = None
         
         # Frame cache per performance ottimizzate
         self.frame_cache: FrameCache | None = None
@@ -456,6 +461,10 @@ class VideoPlayerWidget(QWidget):
         """Imposta l'async loader condiviso."""
         self.async_loader = loader
     
+    def set_sync_manager(self, sync_manager: SyncManager):
+        """Imposta il sync manager condiviso."""
+        self.sync_manager = sync_manager
+    
     def set_frame_cache(self, cache: FrameCache):
         """Imposta la frame cache per questo video.
         
@@ -577,6 +586,7 @@ class VideoPlayerWidget(QWidget):
         # Salva dimensioni e FPS
         self.video_width = info['width']
         self.video_height = info['height']
+        self.aspect_ratio = self.video_width / self.video_height if self.video_height > 0 else 0.0
         self.detected_fps = info['fps']
         if self.detected_fps > 0:
             self.fps_label.setText(f"{self.detected_fps:.2f} FPS")
@@ -705,7 +715,11 @@ class VideoPlayerWidget(QWidget):
         self.status_label.setProperty("status", "error")
         self.status_label.show() # Mostra in caso di errore
         self.fps_label.hide()
+        was_loaded = self.is_loaded
         self.is_loaded = False
+        if was_loaded:
+            # La finestra principale tiene traccia dei player caricati tramite questo segnale
+            self.video_load_state_changed.emit(self.video_index, False)
 
     def play(self):
         """Avvia la riproduzione."""
@@ -949,6 +963,8 @@ class VideoPlayerWidget(QWidget):
             duration = self.media_player.duration()
             
             new_pos = max(0, min(duration, current_pos + total_step))
+            if new_pos == current_pos:
+                return  # Già al bordo: nessun seek (e nessuna ri-decodifica)
             
             self.media_player.setPosition(new_pos)
             logger.log_video_action(self.video_index, f"Step Frame ({frame_count})", f"Posizione: {new_pos}ms")
@@ -995,8 +1011,6 @@ class VideoPlayerWidget(QWidget):
 
     def on_media_status_changed(self, status):
         """Gestisce il cambio di stato del media player."""
-        from PyQt6.QtMultimedia import QMediaPlayer
-        
         # Quando il video è caricato e pronto, carica il frame di preview
         if status == QMediaPlayer.MediaStatus.LoadedMedia:
             # Log solo al primo caricamento, non ad ogni seek
@@ -1014,7 +1028,6 @@ class VideoPlayerWidget(QWidget):
             
             # Inizializza la cache se non esiste e abbiamo un video path
             if not self.frame_cache and self.video_path and self.cache_enabled:
-                from core.frame_cache import FrameCache
                 self.frame_cache = FrameCache(self.video_path, cache_size=50)
                 logger.log_video_action(
                     self.video_index,
@@ -1031,6 +1044,19 @@ class VideoPlayerWidget(QWidget):
         dur_str = format_time(duration)
         self.info_label.setText(f"{pos_str} / {dur_str}")
 
+    def on_force_resync(self, master_position: int, master_index: int):
+        """Allinea timeline ed etichetta tempo alla posizione del master appena sincronizzata."""
+        if not self.is_loaded or self.sync_manager is None:
+            return
+        sync_position = self.sync_manager.calculate_sync_position(
+            source_position=master_position,
+            source_index=master_index,
+            target_index=self.video_index
+        )
+        self.timeline_widget.set_position(sync_position)
+        self.timeline_widget.update()
+        self.update_time_label(sync_position, self.get_duration())
+
     def show_controls(self, show):
         """Mostra/nasconde i controlli individuali."""
         if show:
@@ -1072,7 +1098,6 @@ class VideoPlayerWidget(QWidget):
             filtered_markers = self.marker_manager.get_markers_for_video(self.video_index)
 
             # Crea un manager temporaneo con solo i marker filtrati
-            from core.markers import MarkerManager
             temp_manager = MarkerManager()
             temp_manager.markers = filtered_markers
 
@@ -1261,6 +1286,7 @@ class VideoPlayerWidget(QWidget):
         self.video_path = None
         self.is_loaded = False
         self.detected_fps = 0.0
+        self.aspect_ratio = 0.0
         self._media_ready_logged = False  # Reset flag
 
         # Reset UI